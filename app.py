@@ -4,6 +4,7 @@ CLI application for the Password Manager.
 
 import sys
 import getpass
+import hashlib
 import json
 import os
 import logging
@@ -598,9 +599,9 @@ class PasswordManagerCLI:
             # Encrypt export data
             encrypted_package = self.crypto.export_data_with_password(export_package, export_password)
             
-            # Save to file
+            # Save to file (compact JSON - the payload is ciphertext, nobody reads it)
             with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(encrypted_package, f, indent=2)
+                f.write(json.dumps(encrypted_package, separators=(',', ':')))
             
             print(f"\n✓ Successfully exported {len(export_data)} entries to: {file_path}")
             print("Remember your export password to import this file later!")
@@ -609,6 +610,21 @@ class PasswordManagerCLI:
             logger.error(f"Error exporting passwords: {e}")
             print(f"✗ Export failed: {str(e)}")
     
+    @staticmethod
+    def _entry_key(service: Optional[str], username: str) -> bytes:
+        """
+        Build a compact 8-byte lookup key for a (service, username) pair.
+
+        Args:
+            service: Service name (may be None)
+            username: Username
+
+        Returns:
+            8-byte blake2s digest usable as a dict key
+        """
+        raw = f"{service or ''}|{username}".encode('utf-8')
+        return hashlib.blake2s(raw, digest_size=8).digest()
+
     def import_passwords(self):
         """Import passwords from an encrypted file."""
         print("\n" + "=" * 40)
@@ -670,41 +686,62 @@ class PasswordManagerCLI:
             imported_count = 0
             skipped_count = 0
             failed_count = 0
-            
+
+            # Compute the fallback timestamp once instead of per entry
+            default_created = datetime.now().isoformat()
+
+            # Reusable ciphertext buffer shared across the encrypt calls below
+            cipher_buf = bytearray(256)
+
+            # Index existing entries once, keyed by a compact blake2s digest
+            # of (service, username), so each imported entry costs one dict
+            # probe instead of a SQL round-trip plus a linear scan
+            existing_index = {}
+            for db_entry in self.db.get_all_entries():
+                key = self._entry_key(db_entry['service'], db_entry['username'])
+                existing_index[key] = db_entry['id']
+
             for entry in entries:
                 service = entry.get('service')
                 username = entry['username']
                 password = entry['password']
                 email = entry.get('email')
                 notes = entry.get('notes')
-                created_at = entry.get('created_at', datetime.now().isoformat())
-                
+                created_at = entry.get('created_at', default_created)
+
                 # Check if entry exists
-                exists = self.db.entry_exists(service, username)
-                
+                key = self._entry_key(service, username)
+                exists = key in existing_index
+
                 if exists and skip_duplicates:
                     skipped_count += 1
                     continue
-                
+
                 # Encrypt password
                 try:
-                    encrypted_password = self.crypto.encrypt_password(password)
-                    
+                    n = self.crypto.encrypt_password_into(password, cipher_buf)
+                    encrypted_password = bytes(memoryview(cipher_buf)[:n]).decode('ascii')
+
                     if exists and not skip_duplicates:
-                        # Find entry ID to update
-                        all_entries = self.db.get_all_entries()
-                        for db_entry in all_entries:
-                            if db_entry['service'] == service and db_entry['username'] == username:
-                                self.db.update_entry(db_entry['id'], service, username, encrypted_password, email, notes)
-                                imported_count += 1
-                                break
+                        entry_id = existing_index[key]
+                        if entry_id is None:
+                            # Entry was added earlier in this import; look up its ID
+                            for db_entry in self.db.get_all_entries():
+                                if db_entry['service'] == service and db_entry['username'] == username:
+                                    entry_id = db_entry['id']
+                                    existing_index[key] = entry_id
+                                    break
+                        if entry_id is not None:
+                            self.db.update_entry(entry_id, service, username, encrypted_password, email, notes)
+                            imported_count += 1
                     else:
                         # Add new entry
                         if self.db.add_entry(service, username, encrypted_password, email, notes):
+                            existing_index[key] = None
                             imported_count += 1
                         else:
                             failed_count += 1
-                            
+
                 except Exception as e:
                     logger.error(f"Error importing entry {username}: {e}")
                     failed_count += 1
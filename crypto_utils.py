@@ -5,10 +5,12 @@ Handles encryption, decryption, and key derivation.
 
 import os
 import base64
+import functools
 import logging
 import hashlib
 import secrets
 import json
+import zlib
 from typing import Optional, Dict, List, Any
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
@@ -34,6 +36,10 @@ class CryptoManager:
         self.db = db_manager
         self._fernet = None
         self._master_key = None
+        # Per-instance plaintext cache keyed by ciphertext: repeated bulk
+        # operations (PDF export straight after .enc export) skip the
+        # AES/HMAC work entirely. Cleared whenever the key changes.
+        self._decrypt_cached = functools.lru_cache(maxsize=4096)(self._decrypt_raw)
     
     def generate_salt(self) -> bytes:
         """
@@ -117,7 +123,8 @@ class CryptoManager:
             
             self._master_key = key
             self._fernet = Fernet(key)
-            
+            self._decrypt_cached.cache_clear()
+
             logger.info("Master password initialized successfully")
             return True
         except Exception as e:
@@ -156,12 +163,14 @@ class CryptoManager:
                 logger.info("Authentication successful - key hash verified")
                 self._master_key = key
                 self._fernet = Fernet(key)
+                self._decrypt_cached.cache_clear()
                 return True
             else:
                 # Fallback to encryption test for backward compatibility
                 logger.warning("No stored key hash found, using encryption test only")
                 self._master_key = key
                 self._fernet = Fernet(key)
+                self._decrypt_cached.cache_clear()
                 
                 # Test encryption/decryption
                 test_data = b"test"
@@ -203,23 +212,85 @@ class CryptoManager:
             logger.error(f"Error encrypting password: {e}")
             raise
     
+    def encrypt_password_into(self, password: str, out: bytearray) -> int:
+        """
+        Encrypt a password into a caller-provided buffer.
+
+        Useful for bulk loops (e.g. import) where a single preallocated
+        bytearray is reused across calls instead of allocating a fresh
+        intermediate per entry. The buffer is grown if needed.
+
+        Args:
+            password: Plaintext password
+            out: Preallocated buffer to receive the token
+
+        Returns:
+            Number of token bytes written to out
+        """
+        if not self._fernet:
+            raise RuntimeError("Not authenticated. Call authenticate() first.")
+
+        try:
+            token = self._fernet.encrypt(password.encode('utf-8'))
+            n = len(token)
+            if n > len(out):
+                out.extend(bytes(n - len(out)))
+            out[:n] = token
+            return n
+        except Exception as e:
+            logger.error(f"Error encrypting password: {e}")
+            raise
+
+    def encrypt_many(self, passwords: List[str]) -> List[str]:
+        """
+        Encrypt a batch of passwords with the cached cipher.
+
+        Counterpart to decrypt_many for bulk paths (import, master password
+        change): the Fernet instance is resolved once and the batch runs in
+        one tight loop. The key schedule is derived once per session, so
+        each call costs only the AES/HMAC work.
+
+        Args:
+            passwords: Plaintext passwords
+
+        Returns:
+            Encrypted passwords as base64 strings, in the same order
+
+        Raises:
+            RuntimeError if not authenticated; any encryption error aborts
+            the whole batch.
+        """
+        if not self._fernet:
+            raise RuntimeError("Not authenticated. Call authenticate() first.")
+
+        encrypt = self._fernet.encrypt
+        try:
+            return [
+                encrypt(pw.encode('utf-8')).decode('ascii') for pw in passwords
+            ]
+        except Exception as e:
+            logger.error(f"Error encrypting batch: {e}")
+            raise
+
+    def _decrypt_raw(self, encrypted_password: str) -> str:
+        """Decrypt one token with the current cipher (no caching, no auth check)."""
+        return self._fernet.decrypt(encrypted_password.encode('ascii')).decode('utf-8')
+
     def decrypt_password(self, encrypted_password: str) -> str:
         """
         Decrypt a password.
-        
+
         Args:
             encrypted_password: Encrypted password as base64 string
-            
+
         Returns:
             Decrypted password
         """
         if not self._fernet:
             raise RuntimeError("Not authenticated. Call authenticate() first.")
-        
+
         try:
-            encrypted_bytes = encrypted_password.encode('ascii')
-            decrypted_bytes = self._fernet.decrypt(encrypted_bytes)
-            return decrypted_bytes.decode('utf-8')
+            return self._decrypt_cached(encrypted_password)
         except (InvalidSignature, InvalidKey) as e:
             logger.error(f"Decryption failed - possible tampering: {e}")
             raise
@@ -227,6 +298,48 @@ class CryptoManager:
             logger.error(f"Error decrypting password: {e}")
             raise
     
+    def decrypt_many(self, encrypted_passwords: List[str]) -> List[str]:
+        """
+        Decrypt a batch of passwords with the cached cipher.
+
+        Bulk paths (export, PDF report) previously called decrypt_password
+        once per entry; this resolves the Fernet instance and its decrypt
+        method a single time and runs the batch in one tight loop.
+
+        Args:
+            encrypted_passwords: Encrypted passwords as base64 strings
+
+        Returns:
+            Decrypted passwords, in the same order
+
+        Raises:
+            RuntimeError if not authenticated; any decryption error aborts
+            the whole batch, logged with the index of the offending token.
+        """
+        if not self._fernet:
+            raise RuntimeError("Not authenticated. Call authenticate() first.")
+
+        decrypt = self._decrypt_cached
+        try:
+            return [decrypt(ct) for ct in encrypted_passwords]
+        except Exception as e:
+            # Re-walk only on failure so the hot path stays a bare
+            # comprehension; this pins down which token broke the batch
+            bad_index = -1
+            for i, ct in enumerate(encrypted_passwords):
+                try:
+                    decrypt(ct)
+                except Exception:
+                    bad_index = i
+                    break
+            if isinstance(e, (InvalidSignature, InvalidKey)):
+                logger.error(
+                    f"Batch decryption failed at index {bad_index} - possible tampering: {e}"
+                )
+            else:
+                logger.error(f"Error decrypting batch at index {bad_index}: {e}")
+            raise
+
     def is_authenticated(self) -> bool:
         """
         Check if user is authenticated.
@@ -258,20 +371,22 @@ class CryptoManager:
                 # No entries to re-encrypt, just change salt
                 return self.initialize_master_password(new_password)
             
-            # Decrypt all passwords with old key
-            decrypted_entries = []
-            for entry in entries:
-                try:
-                    decrypted_password = self.decrypt_password(entry['password'])
-                    decrypted_entries.append({
-                        'id': entry['id'],
-                        'service': entry['service'],
-                        'username': entry['username'],
-                        'password': decrypted_password
-                    })
-                except Exception as e:
-                    logger.error(f"Error decrypting entry {entry['id']}: {e}")
-                    return False
+            # Decrypt all passwords with the old key in one batch
+            try:
+                plaintexts = self.decrypt_many([e['password'] for e in entries])
+            except Exception as e:
+                logger.error(f"Error decrypting entries for key change: {e}")
+                return False
+
+            decrypted_entries = [
+                {
+                    'id': entry['id'],
+                    'service': entry['service'],
+                    'username': entry['username'],
+                    'password': plaintext
+                }
+                for entry, plaintext in zip(entries, plaintexts)
+            ]
             
             # Generate new salt and key
             new_salt = self.generate_salt()
@@ -285,10 +400,13 @@ class CryptoManager:
             # Update Fernet instance with new key
             self._fernet = Fernet(new_key)
             self._master_key = new_key
+            self._decrypt_cached.cache_clear()
             
-            # Re-encrypt all passwords with new key
-            for entry in decrypted_entries:
-                new_encrypted_password = self.encrypt_password(entry['password'])
+            # Re-encrypt all passwords with the new key in one batch
+            new_ciphertexts = self.encrypt_many(
+                [entry['password'] for entry in decrypted_entries]
+            )
+            for entry, new_encrypted_password in zip(decrypted_entries, new_ciphertexts):
                 if not self.db.update_entry(
                     entry['id'],
                     entry['service'],
@@ -338,7 +456,46 @@ class CryptoManager:
         except Exception as e:
             logger.error(f"Error exporting data: {e}")
             raise
-    
+
+    def export_blob(self, payload: bytes, export_password: str) -> Dict[str, Any]:
+        """
+        Export a pre-serialized, zlib-compressed payload encrypted with a
+        separate export password (version 2.0 format).
+
+        The caller serializes and compresses once, so only a single byte
+        blob goes through key derivation and Fernet instead of a nested
+        per-field dict.
+
+        Args:
+            payload: Compressed serialized data to encrypt
+            export_password: Password for export encryption
+
+        Returns:
+            Dictionary containing encrypted data and metadata
+        """
+        try:
+            # Generate a new salt for this export
+            export_salt = self.generate_salt()
+
+            # Derive key from export password
+            export_key = self.derive_key_from_password(export_password, export_salt)
+            export_fernet = Fernet(export_key)
+
+            encrypted_data = export_fernet.encrypt(payload)
+
+            # Return export package
+            return {
+                'version': '2.0',
+                'export_date': self.get_current_timestamp(),
+                'salt': base64.b64encode(export_salt).decode('ascii'),
+                'iterations': PBKDF2_ITERATIONS,
+                'encrypted_data': base64.b64encode(encrypted_data).decode('ascii'),
+                'data_hash': hashlib.sha256(payload).hexdigest()
+            }
+        except Exception as e:
+            logger.error(f"Error exporting data: {e}")
+            raise
+
     def import_data_with_password(self, export_package: Dict[str, Any], import_password: str) -> Dict[str, Any]:
         """
         Import data that was encrypted with export password.
@@ -353,7 +510,7 @@ class CryptoManager:
         try:
             # Extract components from export package
             version = export_package.get('version', '1.0')
-            if version != '1.0':
+            if version not in ('1.0', '2.0'):
                 raise ValueError(f"Unsupported export version: {version}")
             
             export_salt = base64.b64decode(export_package['salt'])
@@ -383,7 +540,11 @@ class CryptoManager:
                 actual_hash = hashlib.sha256(decrypted_data).hexdigest()
                 if actual_hash != expected_hash:
                     raise ValueError("Data integrity check failed - file may be corrupted or password incorrect")
-            
+
+            # Version 2.0 payloads are zlib-compressed before encryption
+            if version == '2.0':
+                decrypted_data = zlib.decompress(decrypted_data)
+
             # Parse JSON
             data = json.loads(decrypted_data.decode('utf-8'))
             return data
@@ -5,8 +5,9 @@ Handles SQLite database connection, initialization, and operations.
 
 import sqlite3
 import logging
+import threading
 from datetime import datetime
-from typing import Optional, List, Tuple, Dict, Any
+from typing import Optional, List, Tuple, Dict, Any, Iterator
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
@@ -23,11 +24,24 @@ class DatabaseManager:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
+        self._bulk_conn = None
+        self._bulk_thread = None
         self._init_database()
-    
+
     @contextmanager
     def _get_connection(self):
-        """Context manager for database connections."""
+        """
+        Context manager for database connections.
+
+        Inside a begin_bulk()/commit_bulk() window, calls from the thread
+        that opened the bulk transaction share its connection and defer the
+        commit; everything else keeps the one-connection-per-call behavior.
+        """
+        if (self._bulk_conn is not None
+                and self._bulk_thread == threading.get_ident()):
+            yield self._bulk_conn
+            return
+
         conn = None
         try:
             conn = sqlite3.connect(self.db_path)
@@ -42,7 +56,39 @@ class DatabaseManager:
         finally:
             if conn:
                 conn.close()
-    
+
+    def begin_bulk(self):
+        """
+        Open a single transaction for a batch of writes.
+
+        Until commit_bulk(), every call from this thread reuses one
+        connection under BEGIN IMMEDIATE, collapsing per-row commits (and
+        their fsyncs) into one. No-op if a bulk window is already open.
+        """
+        if self._bulk_conn is not None:
+            return
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        conn.execute("BEGIN IMMEDIATE")
+        self._bulk_conn = conn
+        self._bulk_thread = threading.get_ident()
+
+    def commit_bulk(self):
+        """Commit and close the transaction opened by begin_bulk()."""
+        conn = self._bulk_conn
+        if conn is None:
+            return
+        self._bulk_conn = None
+        self._bulk_thread = None
+        try:
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Error committing bulk transaction: {e}")
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
     def _init_database(self):
         """Initialize database with required tables."""
         with self._get_connection() as conn:
@@ -122,9 +168,21 @@ class DatabaseManager:
                 ON vault(service)
             """)
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_email 
+                CREATE INDEX IF NOT EXISTS idx_email
                 ON vault(email)
             """)
+
+            # Unique index so duplicate detection happens inside the INSERT
+            # itself instead of a separate lookup. Legacy databases may
+            # already hold duplicates, in which case the index can't be
+            # built and callers fall back to plain inserts.
+            try:
+                cursor.execute("""
+                    CREATE UNIQUE INDEX IF NOT EXISTS idx_service_username
+                    ON vault(service, username)
+                """)
+            except sqlite3.Error as e:
+                logger.warning(f"Could not create unique index (existing duplicates?): {e}")
     
     def get_master_salt(self) -> Optional[bytes]:
         """
@@ -196,13 +254,17 @@ class DatabaseManager:
             encrypted_password: Encrypted password
             email: Email address (optional)
             notes: Additional notes (optional)
-            
+
         Returns:
             True if successful, False otherwise
+
+        Raises:
+            sqlite3.IntegrityError if (service, username) already exists,
+            so callers can offer an overwrite without a prior lookup
         """
         if not username or not encrypted_password:
             return False
-            
+
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
@@ -212,6 +274,8 @@ class DatabaseManager:
                 """, (service, username, encrypted_password, email, notes,
                       datetime.now().isoformat()))
                 return True
+        except sqlite3.IntegrityError:
+            raise
         except sqlite3.Error as e:
             logger.error(f"Error adding entry: {e}")
             return False
@@ -242,23 +306,52 @@ class DatabaseManager:
     def get_all_entries(self) -> List[Dict[str, Any]]:
         """
         Get all password entries, sorted by creation date.
-        
+
         Returns:
-            List of entry dictionaries
+            List of entry dictionaries. created_display holds the timestamp
+            preformatted by SQLite for list views, saving a Python-side
+            parse + reformat per row.
         """
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
-                    SELECT id, service, username, password, email, notes, created_at
-                    FROM vault 
+                    SELECT id, service, username, password, email, notes, created_at,
+                           strftime('%Y-%m-%d %H:%M', created_at) AS created_display
+                    FROM vault
                     ORDER BY created_at DESC
                 """)
                 return [dict(row) for row in cursor.fetchall()]
         except sqlite3.Error as e:
             logger.error(f"Error getting all entries: {e}")
             return []
-    
+
+    def iter_all_entries(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all password entries, sorted by creation date.
+
+        Streaming variant of get_all_entries: rows come straight off the
+        cursor one at a time, so callers that transform each entry never
+        hold the whole vault as dictionaries. The connection stays open
+        until the generator is exhausted or closed.
+
+        Yields:
+            Entry dictionaries with the same columns as get_all_entries
+        """
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT id, service, username, password, email, notes, created_at,
+                           strftime('%Y-%m-%d %H:%M', created_at) AS created_display
+                    FROM vault
+                    ORDER BY created_at DESC
+                """)
+                for row in cursor:
+                    yield dict(row)
+        except sqlite3.Error as e:
+            logger.error(f"Error iterating entries: {e}")
+
     def get_entries_by_service(self, service: str) -> List[Dict[str, Any]]:
         """
         Get entries by service name.
@@ -302,14 +395,18 @@ class DatabaseManager:
             logger.error(f"Error deleting entry: {e}")
             return False
     
-    def entry_exists(self, service: str, username: str) -> bool:
+    def entry_exists(self, service: Optional[str], username: str) -> bool:
         """
         Check if an entry already exists.
-        
+
+        Uses IS for the service comparison so entries saved without a
+        service are found too, and stops at the first hit instead of
+        counting the table.
+
         Args:
-            service: Service name
+            service: Service name (may be None)
             username: Username
-            
+
         Returns:
             True if entry exists, False otherwise
         """
@@ -317,15 +414,40 @@ class DatabaseManager:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
-                    SELECT COUNT(*) as count 
-                    FROM vault 
-                    WHERE service = ? AND username = ?
+                    SELECT 1
+                    FROM vault
+                    WHERE service IS ? AND username = ?
+                    LIMIT 1
                 """, (service, username))
-                result = cursor.fetchone()
-                return result['count'] > 0 if result else False
+                return cursor.fetchone() is not None
         except sqlite3.Error as e:
             logger.error(f"Error checking entry existence: {e}")
             return False
+
+    def get_entry_id(self, service: Optional[str], username: str) -> Optional[int]:
+        """
+        Look up the id of the entry for (service, username).
+
+        Args:
+            service: Service name (may be None)
+            username: Username
+
+        Returns:
+            Entry id if found, None otherwise
+        """
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT id
+                    FROM vault
+                    WHERE service IS ? AND username = ?
+                """, (service, username))
+                result = cursor.fetchone()
+                return result['id'] if result else None
+        except sqlite3.Error as e:
+            logger.error(f"Error looking up entry id: {e}")
+            return None
     
     def update_entry(self, entry_id: int, service: Optional[str], 
                      username: str, encrypted_password: str, 
@@ -427,8 +549,9 @@ class DatabaseManager:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
-                    SELECT id, service, username, password, email, notes, created_at
-                    FROM vault 
+                    SELECT id, service, username, password, email, notes, created_at,
+                           strftime('%Y-%m-%d %H:%M', created_at) AS created_display
+                    FROM vault
                     WHERE service LIKE ? OR username LIKE ? OR email LIKE ?
                     ORDER BY created_at DESC
                 """, (f"%{search_term}%", f"%{search_term}%", f"%{search_term}%"))
@@ -4,25 +4,75 @@ Main application file - Password Manager with PyQt5 GUI.
 
 import sys
 import os
+import functools
 import logging
+import sqlite3
+from collections import OrderedDict
 from datetime import datetime
+from string import Template
 import json
+import mmap
+import zlib
+
+try:
+    import orjson
+except ImportError:  # optional C serializer; stdlib json is the fallback
+    orjson = None
+
+from PyQt5.QtWidgets import (
+    QApplication,
+    QCheckBox,
+    QDialog,
+    QDialogButtonBox,
+    QFileDialog,
+    QFrame,
+    QGridLayout,
+    QGroupBox,
+    QHBoxLayout,
+    QHeaderView,
+    QInputDialog,
+    QLabel,
+    QLineEdit,
+    QListWidget,
+    QMainWindow,
+    QMessageBox,
+    QProgressDialog,
+    QPushButton,
+    QRadioButton,
+    QScrollArea,
+    QSlider,
+    QTableView,
+    QTextEdit,
+    QVBoxLayout,
+    QWidget,
+)
+from PyQt5.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QSignalBlocker,
+    QSize,
+    QThread,
+    QThreadPool,
+    QTimer,
+    Qt,
+    pyqtSignal,
+    pyqtSlot,
+)
+from PyQt5.QtGui import QColor, QFont, QIcon, QPixmapCache
 
-from PyQt5.QtWidgets import *
-from PyQt5.QtCore import *
-from PyQt5.QtGui import *
-import pyperclip
-
-# PDF Generation
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.units import inch
+# reportlab (PDF generation) is imported lazily inside create_pdf_report so
+# opening the app does not pay for loading it.
 
 from db import DatabaseManager
 from crypto_utils import CryptoManager
-from password_generator import PasswordGenerator
+from password_generator import (
+    PasswordGenerator,
+    calculate_entropy as _pg_entropy,
+    evaluate_strength as _pg_evaluate,
+    generate_password as _pg_generate,
+)
 from config import (
     APP_NAME,
     APP_VERSION,
@@ -36,124 +86,62 @@ from config import (
 logger = logging.getLogger(__name__)
 
 
-class PasswordManagerGUI(QMainWindow):
-    """Main GUI application for the password manager using PyQt5."""
-
-    def __init__(self):
-        """Initialize the GUI application."""
-        super().__init__()
-        self.authenticated = False
-        self.current_entry_id = None
-        self.id_mapping = {}
-        self.button_images = {}
-        self.dark_mode = False
-
-        # Initialize managers
-        self.db = DatabaseManager()
-        self.crypto = CryptoManager(self.db)
-        self.password_gen = PasswordGenerator()
-
-        # Load button images
-        self.load_button_images()
-
-        # Setup UI
-        self.init_ui()
-
-        # Check if master password is set
-        self.check_first_run()
-
-    def load_button_images(self):
-        """Load images for buttons from Images folder."""
-        try:
-            image_folder = "Images"
-            if os.path.exists(image_folder):
-                # Map image names to button purposes
-                image_mapping = {
-                    "authentication.png": "authenticate",
-                    "add.png": "add",
-                    "updated.png": "update",
-                    "delete.png": "delete",
-                    "copy.png": "copy",
-                    "generate.png": "generate",
-                    "refresh.png": "refresh",
-                    "export.png": "export_encrypted",
-                    "import.png": "import",
-                    "exit.png": "exit",
-                    "show.png": "show",
-                    "hidden.png": "hide",
-                    "Change-password.png": "change_password",
-                    "search.png": "search",
-                    "about.png": "about",
-                    "dark.png": "dark_mode",
-                }
-
-                for image_file, key in image_mapping.items():
-                    image_path = os.path.join(image_folder, image_file)
-                    if os.path.exists(image_path):
-                        self.button_images[key] = QIcon(image_path)
-                        logger.info(f"Loaded image: {image_path}")
-                    else:
-                        logger.warning(f"Image not found: {image_path}")
-
-            # Set window icon
-            icon_path = (
-                os.path.join(image_folder, "reset-password.ico")
-                if image_folder
-                else "reset-password.ico"
-            )
-            if os.path.exists(icon_path):
-                self.setWindowIcon(QIcon(icon_path))
-
-        except Exception as e:
-            logger.error(f"Error loading images: {e}")
-            self.button_images = {}
-
-    def init_ui(self):
-        """Initialize the user interface."""
-        self.setWindowTitle(f"{APP_NAME} v{APP_VERSION}")
-        self.setGeometry(100, 100, 1350, 750)
-        self.setMinimumSize(1200, 700)
-
-        # Apply light mode style by default
-        self.apply_light_theme()
-
-        # Create central widget
-        central_widget = QWidget()
-        central_widget.setObjectName("centralWidget")
-        self.setCentralWidget(central_widget)
+# The light and dark stylesheets share ~95% of their rules; a single
+# template plus two token dicts keeps them from drifting apart. Compiled
+# stylesheets are memoized so each theme is string-built at most once per
+# process.
+# The gradient "role" buttons all share one rule shape; per-role colors live
+# in these tables and the QSS rule pairs are generated from them, so a new
+# role is one tuple instead of two hand-written rule blocks. Columns:
+# (class, stop0, stop1, hover stop0, hover stop1, text color, hover border).
+_BUTTON_ROLES = (
+    ("primary-button", "#5DADE2", "#2E86C1", "#2E86C1", "#1B4965", "white", "rgba(255, 255, 255, 0.3)"),
+    ("success-button", "#58D68D", "#2ECC71", "#2ECC71", "#27AE60", "white", "rgba(255, 255, 255, 0.3)"),
+    ("warning-button", "#F8B739", "#F39C12", "#F39C12", "#D68910", "white", "rgba(255, 255, 255, 0.3)"),
+    ("danger-button", "#EC7063", "#E74C3C", "#E74C3C", "#C0392B", "white", "rgba(255, 255, 255, 0.3)"),
+    ("info-button", "#52B6D6", "#2BA8B5", "#2BA8B5", "#16A085", "white", "rgba(255, 255, 255, 0.3)"),
+)
 
-        # Main layout
-        main_layout = QVBoxLayout(central_widget)
-        main_layout.setContentsMargins(20, 20, 20, 20)
-        main_layout.setSpacing(15)
+_ABOUT_ROLE = ("about-button", "#B974D6", "#9B59B6", "#9B59B6", "#8E44AD", "white", "rgba(255, 255, 255, 0.3)")
 
-        # Status bar at top - Header removed as requested
-        status_bar = self.create_status_bar()
-        main_layout.addWidget(status_bar)
+# The dark-mode toggle is the one role whose colors differ between themes
+_DARKMODE_ROLE_LIGHT = ("dark-mode-button", "#34495E", "#1A252F", "#1A252F", "#0F1620", "white", "rgba(255, 255, 255, 0.3)")
+_DARKMODE_ROLE_DARK = ("dark-mode-button", "#FFD700", "#FFA500", "#FFA500", "#FF8C00", "#1a1a1a", "rgba(0, 0, 0, 0.3)")
 
-        # Main content area
-        content_widget = self.create_content_area()
-        main_layout.addWidget(content_widget, 1)
 
-        # Button panel
-        button_panel = self.create_button_panel()
-        main_layout.addWidget(button_panel)
+def _role_button_rules(roles):
+    """Render the base + hover QSS rule pair for each gradient role."""
+    rules = []
+    for name, stop0, stop1, hover0, hover1, fg, hover_border in roles:
+        rules.append(
+            f"""            .{name} {{
+                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                    stop: 0 {stop0}, stop: 1 {stop1});
+                color: {fg};
+                font-weight: bold;
+                border: 2px solid transparent;
+            }}
+            
+            .{name}:hover {{
+                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                    stop: 0 {hover0}, stop: 1 {hover1});
+                border: 2px solid {hover_border};
+            }}
+            
+"""
+        )
+    return "".join(rules)
 
-        # Connect signals
-        self.entries_table.itemSelectionChanged.connect(self.on_entry_select)
 
-    def apply_light_theme(self):
-        """Apply light theme stylesheet."""
-        self.setStyleSheet(
-            """
+_THEME_TEMPLATE = Template("""
             QMainWindow {
-                background-color: #f0f2f5;
+                background-color: ${window_bg};
             }
             
             QWidget#centralWidget {
-                background-color: white;
+                background-color: ${panel_bg};
                 border-radius: 15px;
-                border: 2px solid #e0e0e0;
+                border: 2px solid ${panel_border};
             }
             
             QPushButton {
@@ -163,144 +151,46 @@ class PasswordManagerGUI(QMainWindow):
                 font-size: 13px;
                 border: 2px solid transparent;
                 margin: 3px;
-                min-height: 20px;
+                min-height: 20px;${button_extra}
             }
             
             QPushButton:hover {
-                border: 2px solid rgba(52, 152, 219, 0.5);
+                border: 2px solid rgba(52, 152, 219, 0.5);${button_hover_extra}
             }
             
             QPushButton:pressed {
-                border: 2px solid rgba(52, 152, 219, 0.8);
-            }
-            
-            .primary-button {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #5DADE2, stop: 1 #2E86C1);
-                color: white;
-                font-weight: bold;
-                border: 2px solid transparent;
-            }
-            
-            .primary-button:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #2E86C1, stop: 1 #1B4965);
-                border: 2px solid rgba(255, 255, 255, 0.3);
-            }
-            
-            .success-button {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #58D68D, stop: 1 #2ECC71);
-                color: white;
-                font-weight: bold;
-                border: 2px solid transparent;
-            }
-            
-            .success-button:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #2ECC71, stop: 1 #27AE60);
-                border: 2px solid rgba(255, 255, 255, 0.3);
-            }
-            
-            .warning-button {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #F8B739, stop: 1 #F39C12);
-                color: white;
-                font-weight: bold;
-                border: 2px solid transparent;
-            }
-            
-            .warning-button:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #F39C12, stop: 1 #D68910);
-                border: 2px solid rgba(255, 255, 255, 0.3);
-            }
-            
-            .danger-button {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #EC7063, stop: 1 #E74C3C);
-                color: white;
-                font-weight: bold;
-                border: 2px solid transparent;
-            }
-            
-            .danger-button:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #E74C3C, stop: 1 #C0392B);
-                border: 2px solid rgba(255, 255, 255, 0.3);
-            }
-            
-            .info-button {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #52B6D6, stop: 1 #2BA8B5);
-                color: white;
-                font-weight: bold;
-                border: 2px solid transparent;
-            }
-            
-            .info-button:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #2BA8B5, stop: 1 #16A085);
-                border: 2px solid rgba(255, 255, 255, 0.3);
-            }
-            
-            .dark-mode-button {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #34495E, stop: 1 #1A252F);
-                color: white;
-                font-weight: bold;
-                border: 2px solid transparent;
-            }
-            
-            .dark-mode-button:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #1A252F, stop: 1 #0F1620);
-                border: 2px solid rgba(255, 255, 255, 0.3);
-            }
-            
-            .about-button {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #B974D6, stop: 1 #9B59B6);
-                color: white;
-                font-weight: bold;
-                border: 2px solid transparent;
-            }
-            
-            .about-button:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #9B59B6, stop: 1 #8E44AD);
-                border: 2px solid rgba(255, 255, 255, 0.3);
+                border: 2px solid rgba(52, 152, 219, 0.8);${button_pressed_extra}
             }
             
-            QLineEdit, QTextEdit {
+${role_buttons}            QLineEdit, QTextEdit {
                 padding: 8px;
-                border: 2px solid #ddd;
+                border: 2px solid ${input_border};
                 border-radius: 6px;
                 font-size: 14px;
-                background-color: white;
-                color: #333;
+                background-color: ${input_bg};
+                color: ${input_fg};
             }
             
             QLineEdit:focus, QTextEdit:focus {
                 border-color: #3498db;
             }
             
-            QTableWidget {
-                background-color: white;
-                border: 2px solid #ddd;
+            QTableView {
+                background-color: ${input_bg};
+                border: 2px solid ${input_border};
                 border-radius: 8px;
-                alternate-background-color: #f8f9fa;
+                alternate-background-color: ${table_alt};
                 selection-background-color: #3498db;
                 selection-color: white;
-                font-size: 12px;
+                font-size: 12px;${table_extra}
             }
             
-            QTableWidget::item {
-                padding: 8px;
+            QTableView::item {
+                padding: 8px;${table_item_extra}
             }
             
             QHeaderView::section {
-                background-color: #2c3e50;
+                background-color: ${header_bg};
                 color: white;
                 padding: 10px;
                 font-weight: bold;
@@ -309,13 +199,13 @@ class PasswordManagerGUI(QMainWindow):
             
             QLabel {
                 font-size: 14px;
-                color: #333;
+                color: ${label_fg};
             }
             
             QLabel#titleLabel {
                 font-size: 24px;
                 font-weight: bold;
-                color: #2c3e50;
+                color: ${title_fg};
             }
             
             QLabel#statusLabel {
@@ -330,34 +220,34 @@ class PasswordManagerGUI(QMainWindow):
                 font-weight: bold;
                 padding: 5px;
                 border-radius: 5px;
-                text-align: center;
+                text-align: center;${strength_extra}
             }
             
             QLabel#statsLabel {
                 font-size: 12px;
-                color: #7f8c8d;
+                color: ${stats_fg};
             }
             
             QGroupBox {
-                border: 2px solid #ddd;
+                border: 2px solid ${input_border};
                 border-radius: 8px;
                 margin-top: 10px;
                 font-weight: bold;
-                color: #2c3e50;
+                color: ${title_fg};
             }
             
             QGroupBox::title {
                 subcontrol-origin: margin;
                 left: 10px;
-                padding: 0 5px 0 5px;
+                padding: 0 5px 0 5px;${group_title_extra}
             }
             
             QMessageBox {
-                background-color: white;
+                background-color: ${panel_bg};
             }
             
             QMessageBox QLabel {
-                color: #333333;
+                color: ${dialog_fg};
                 font-size: 14px;
             }
             
@@ -379,18 +269,18 @@ class PasswordManagerGUI(QMainWindow):
             }
             
             QInputDialog {
-                background-color: white;
+                background-color: ${panel_bg};
             }
             
             QInputDialog QLabel {
-                color: #333333;
+                color: ${dialog_fg};
                 font-size: 14px;
             }
             
             QInputDialog QLineEdit {
-                background-color: white;
-                color: #333333;
-                border: 2px solid #ddd;
+                background-color: ${input_bg};
+                color: ${dialog_input_fg};
+                border: 2px solid ${input_border};
                 border-radius: 6px;
                 padding: 8px;
             }
@@ -407,285 +297,847 @@ class PasswordManagerGUI(QMainWindow):
             QInputDialog QPushButton:hover {
                 background-color: #2980b9;
             }
+""")
+
+_LIGHT_TOKENS = {
+    'window_bg': '#f0f2f5',
+    'panel_bg': 'white',
+    'panel_border': '#e0e0e0',
+    'button_extra': '',
+    'button_hover_extra': '',
+    'button_pressed_extra': '',
+    'input_border': '#ddd',
+    'input_bg': 'white',
+    'input_fg': '#333',
+    'table_alt': '#f8f9fa',
+    'table_extra': '',
+    'table_item_extra': '',
+    'header_bg': '#2c3e50',
+    'label_fg': '#333',
+    'title_fg': '#2c3e50',
+    'strength_extra': '',
+    'stats_fg': '#7f8c8d',
+    'group_title_extra': '',
+    'dialog_fg': '#333333',
+    'dialog_input_fg': '#333333',
+    'role_buttons': _role_button_rules(_BUTTON_ROLES + (_DARKMODE_ROLE_LIGHT, _ABOUT_ROLE)),
+}
+
+_DARK_TOKENS = {
+    'window_bg': '#121212',
+    'panel_bg': '#1e1e1e',
+    'panel_border': '#333',
+    'button_extra': '\n                color: #ffffff;\n                background-color: #2d2d2d;',
+    'button_hover_extra': '\n                background-color: #383838;',
+    'button_pressed_extra': '\n                background-color: #2d2d2d;',
+    'input_border': '#444',
+    'input_bg': '#2d2d2d',
+    'input_fg': '#ffffff',
+    'table_alt': '#333',
+    'table_extra': '\n                color: #ffffff;',
+    'table_item_extra': '\n                color: #ffffff;',
+    'header_bg': '#3498db',
+    'label_fg': '#ffffff',
+    'title_fg': '#ffffff',
+    'strength_extra': '\n                color: #ffffff;',
+    'stats_fg': '#b0bec5',
+    'group_title_extra': '\n                color: #ffffff;',
+    'dialog_fg': '#e0e0e0',
+    'dialog_input_fg': '#ffffff',
+    'role_buttons': _role_button_rules(_BUTTON_ROLES + (_DARKMODE_ROLE_DARK, _ABOUT_ROLE)),
+}
+
+_COMPILED_THEMES = {}
+
+
+def _theme_qss(dark):
+    """Return the compiled stylesheet for the requested theme."""
+    qss = _COMPILED_THEMES.get(dark)
+    if qss is None:
+        tokens = _DARK_TOKENS if dark else _LIGHT_TOKENS
+        qss = _THEME_TEMPLATE.substitute(tokens)
+        _COMPILED_THEMES[dark] = qss
+    return qss
+
+
+# Inline widget styles swapped on theme toggle / auth changes, hoisted so the
+# handlers re-apply shared strings instead of rebuilding the literals each time
+_TITLE_LIGHT_QSS = """
+            font-size: 18px;
+            font-weight: bold;
+            color: #2c3e50;
+            padding-bottom: 10px;
+            border-bottom: 2px solid #3498db;
         """
-        )
+_TITLE_DARK_QSS = """
+            font-size: 18px;
+            font-weight: bold;
+            color: #ffffff;
+            padding-bottom: 10px;
+            border-bottom: 2px solid #3498db;
+        """
+_STATUS_OK_QSS = "background-color: #27ae60; color: white;"
+_STATUS_BAD_QSS = "background-color: #e74c3c; color: white;"
+_STATS_LIGHT_QSS = "color: #7f8c8d; font-size: 12px;"
+_STATS_DARK_QSS = "color: #b0bec5; font-size: 12px;"
 
-    def apply_dark_theme(self):
-        """Apply dark theme stylesheet."""
-        self.setStyleSheet(
-            """
-            QMainWindow {
-                background-color: #121212;
-            }
-            
-            QWidget#centralWidget {
-                background-color: #1e1e1e;
-                border-radius: 15px;
-                border: 2px solid #333;
-            }
-            
-            QPushButton {
-                padding: 12px 20px;
-                border-radius: 10px;
-                font-weight: 600;
-                font-size: 13px;
-                border: 2px solid transparent;
-                margin: 3px;
-                min-height: 20px;
-                color: #ffffff;
-                background-color: #2d2d2d;
-            }
-            
-            QPushButton:hover {
-                border: 2px solid rgba(52, 152, 219, 0.5);
-                background-color: #383838;
-            }
-            
-            QPushButton:pressed {
-                border: 2px solid rgba(52, 152, 219, 0.8);
-                background-color: #2d2d2d;
-            }
-            
-            .primary-button {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #5DADE2, stop: 1 #2E86C1);
-                color: white;
-                font-weight: bold;
-                border: 2px solid transparent;
-            }
-            
-            .primary-button:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #2E86C1, stop: 1 #1B4965);
-                border: 2px solid rgba(255, 255, 255, 0.3);
-            }
-            
-            .success-button {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #58D68D, stop: 1 #2ECC71);
-                color: white;
-                font-weight: bold;
-                border: 2px solid transparent;
-            }
-            
-            .success-button:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #2ECC71, stop: 1 #27AE60);
-                border: 2px solid rgba(255, 255, 255, 0.3);
-            }
-            
-            .warning-button {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #F8B739, stop: 1 #F39C12);
-                color: white;
-                font-weight: bold;
-                border: 2px solid transparent;
-            }
-            
-            .warning-button:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #F39C12, stop: 1 #D68910);
-                border: 2px solid rgba(255, 255, 255, 0.3);
-            }
-            
-            .danger-button {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #EC7063, stop: 1 #E74C3C);
-                color: white;
-                font-weight: bold;
-                border: 2px solid transparent;
-            }
-            
-            .danger-button:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #E74C3C, stop: 1 #C0392B);
-                border: 2px solid rgba(255, 255, 255, 0.3);
-            }
-            
-            .info-button {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #52B6D6, stop: 1 #2BA8B5);
-                color: white;
-                font-weight: bold;
-                border: 2px solid transparent;
-            }
-            
-            .info-button:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #2BA8B5, stop: 1 #16A085);
-                border: 2px solid rgba(255, 255, 255, 0.3);
-            }
-            
-            .dark-mode-button {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #FFD700, stop: 1 #FFA500);
-                color: #1a1a1a;
+
+def _set_qss_if_changed(widget, qss):
+    """Apply qss only if it differs from the widget's current sheet.
+
+    setStyleSheet re-parses and re-polishes even when handed the string it
+    already has; this guard makes redundant applications free.
+    """
+    if widget.styleSheet() != qss:
+        widget.setStyleSheet(qss)
+
+
+_MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June", "July",
+    "August", "September", "October", "November", "December",
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_created(iso, fmt="%d %B %Y, %I:%M %p"):
+    """
+    Format a stored ISO timestamp for display, memoized on the raw string.
+
+    Timestamps repeat across report rows and refreshes, so each unique
+    value is formatted once. The date-only PDF format is sliced straight
+    out of the "YYYY-MM-DD ..." string — no datetime object at all;
+    other formats (and unexpected values) fall back to the parse +
+    strftime pair. Unparseable values come back unchanged, matching the
+    old inline try/except behavior.
+    """
+    try:
+        if fmt == "%d %B %Y" and len(iso) >= 10 and iso[4] == "-":
+            return f"{iso[8:10]} {_MONTH_NAMES[int(iso[5:7]) - 1]} {iso[0:4]}"
+        return datetime.fromisoformat(iso).strftime(fmt)
+    except (ValueError, TypeError, IndexError):
+        return iso
+
+
+def _build_pdf_row(i, entry, password, cell_style, Paragraph, string_width,
+                   email_avail, password_avail, single_line_h):
+    """
+    Build one PDF entries-table row plus its precomputed height.
+
+    Module-level with every dependency passed in so the hot per-row loop in
+    create_pdf_report runs against locals only — no attribute or global
+    lookups per iteration. Returns (row_cells, height) where height is the
+    fixed single-line value when both wrappable columns fit, or None to let
+    Platypus measure the rare wrapping row.
+    """
+    email_text = entry["email"] or "N/A"
+
+    if (
+        string_width(email_text, "Helvetica", 9) <= email_avail
+        and string_width(password, "Helvetica", 9) <= password_avail
+    ):
+        height = single_line_h
+    else:
+        height = None
+
+    # Plain strings take ReportLab's fast text path; Paragraph (and its
+    # XML parse) is kept only for the columns long enough to need
+    # wrapping. Fonts/colors come from the table style.
+    row = [
+        str(i + 1),
+        entry["service"] or "N/A",
+        entry["username"],
+        Paragraph(email_text, cell_style),
+        Paragraph(password, cell_style),
+        _fmt_created(entry["created_at"], "%d %B %Y"),
+    ]
+    return row, height
+
+
+def _box_container(layout_cls, name=None, margins=None, spacing=None):
+    """Build a QWidget with a child layout in one call.
+
+    The create_* methods repeat the widget + layout + margins + spacing
+    sequence for every container; collapsing it keeps init_ui focused on
+    structure.
+    """
+    widget = QWidget()
+    if name:
+        widget.setObjectName(name)
+    layout = layout_cls(widget)
+    if margins is not None:
+        layout.setContentsMargins(*margins)
+    if spacing is not None:
+        layout.setSpacing(spacing)
+    return widget, layout
+
+
+def _vbox(name=None, margins=None, spacing=None):
+    """QWidget + QVBoxLayout pair."""
+    return _box_container(QVBoxLayout, name, margins, spacing)
+
+
+def _hbox(name=None, margins=None, spacing=None):
+    """QWidget + QHBoxLayout pair."""
+    return _box_container(QHBoxLayout, name, margins, spacing)
+
+
+def _copy_to_clipboard(text):
+    """
+    Copy text via the in-process Qt clipboard and schedule an auto-wipe.
+
+    Replaces pyperclip, which forks an external helper (xclip/xsel) on every
+    copy. The clipboard is cleared after 30 seconds so copied secrets don't
+    linger indefinitely — but only if it still holds the copied text, so a
+    later unrelated copy is never wiped.
+    """
+    clipboard = QApplication.clipboard()
+    clipboard.setText(text)
+
+    def _clear_if_unchanged():
+        if clipboard.text() == text:
+            clipboard.clear()
+
+    QTimer.singleShot(30_000, _clear_if_unchanged)
+
+
+# Most recently viewed plaintexts kept for instant re-selection; small on
+# purpose so decrypted secrets don't accumulate
+_DEC_CACHE_MAX = 64
+
+
+@functools.lru_cache(maxsize=8192)
+def _build_row(entry_id, service, username, email, created_display, created_at):
+    """
+    Build the position-independent pieces of one table row.
+
+    Returns the five display columns (service through created), the muted
+    flag, the database id and the lowercased search blob. Keyed by the full
+    field tuple, so a changed entry simply misses the cache and stale
+    results can never be served; across refreshes unchanged entries skip
+    all the lowering/joining work.
+    """
+    return (
+        service or "N/A",
+        username,
+        email or "N/A",
+        # SQLite preformats the display date; fall back to the raw value
+        # for timestamps strftime can't parse
+        created_display or created_at,
+        not service,
+        entry_id,
+        "\x00".join(((service or "").lower(), username.lower(), (email or "").lower())),
+    )
+
+
+def _strength_qss(color):
+    return (
+        f"""
+                background-color: {color}15;
+                color: {color};
+                border: 1px solid {color}30;
                 font-weight: bold;
-                border: 2px solid transparent;
-            }
-            
-            .dark-mode-button:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #FFA500, stop: 1 #FF8C00);
-                border: 2px solid rgba(0, 0, 0, 0.3);
-            }
-            
-            .about-button {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #B974D6, stop: 1 #9B59B6);
+            """
+    )
+
+
+# Strength-indicator stylesheets prebuilt per bucket, so a keystroke never
+# rebuilds or re-parses QSS — the label just switches between fixed strings
+_STRENGTH_STYLES = {
+    "Very Weak": _strength_qss("#e74c3c"),
+    "Weak": _strength_qss("#e67e22"),
+    "Moderate": _strength_qss("#f1c40f"),
+    "Strong": _strength_qss("#2ecc71"),
+    "Very Strong": _strength_qss("#27ae60"),
+}
+_STRENGTH_FALLBACK_QSS = _strength_qss("#333")
+
+
+# Generator-dialog stylesheets, frozen at import: reopening the dialog hands
+# Qt the exact same strings, so its parsed-rule cache is reused instead of
+# re-parsing freshly built literals every time. The four action buttons are
+# addressed by objectName from the one dialog-level sheet rather than
+# carrying individual stylesheets, so the dialog needs a single QSS parse.
+def _gen_button_rules(name, color, hover):
+    return f"""
+            QPushButton#{name} {{
+                background-color: {color};
                 color: white;
-                font-weight: bold;
-                border: 2px solid transparent;
-            }
-            
-            .about-button:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #9B59B6, stop: 1 #8E44AD);
-                border: 2px solid rgba(255, 255, 255, 0.3);
-            }
-            
-            QLineEdit, QTextEdit {
-                padding: 8px;
-                border: 2px solid #444;
+                padding: 8px 15px;
                 border-radius: 6px;
-                font-size: 14px;
-                background-color: #2d2d2d;
-                color: #ffffff;
-            }
-            
-            QLineEdit:focus, QTextEdit:focus {
-                border-color: #3498db;
-            }
-            
-            QTableWidget {
-                background-color: #2d2d2d;
-                border: 2px solid #444;
-                border-radius: 8px;
-                alternate-background-color: #333;
-                selection-background-color: #3498db;
-                selection-color: white;
-                font-size: 12px;
-                color: #ffffff;
-            }
-            
-            QTableWidget::item {
-                padding: 8px;
-                color: #ffffff;
-            }
-            
-            QHeaderView::section {
-                background-color: #3498db;
-                color: white;
-                padding: 10px;
-                font-weight: bold;
-                border: none;
-            }
-            
-            QLabel {
-                font-size: 14px;
-                color: #ffffff;
-            }
-            
-            QLabel#titleLabel {
-                font-size: 24px;
-                font-weight: bold;
-                color: #ffffff;
-            }
-            
-            QLabel#statusLabel {
-                font-size: 12px;
-                font-weight: bold;
-                padding: 5px 10px;
+                font-weight: normal;
+            }}
+            QPushButton#{name}:hover {{
+                background-color: {hover};
+            }}
+        """
+
+
+_GEN_ACTION_BTN_QSS = "".join(
+    _gen_button_rules(name, color, hover)
+    for name, color, hover in (
+        ("genBtn", "#3498db", "#2980b9"),
+        ("copyBtn", "#27ae60", "#229954"),
+        ("useBtn", "#f39c12", "#d68910"),
+        ("cancelBtn", "#e74c3c", "#c0392b"),
+    )
+)
+
+# Theme-dependent widget styles keyed by dark_mode
+_GEN_LENGTH_LABEL_QSS = {
+    True: """
+            font-weight: bold;
+            font-size: 14px;
+            color: #2ECC71;
+        """,
+    False: """
+            font-weight: bold;
+            font-size: 14px;
+            color: #2c3e50;
+        """,
+}
+
+_GEN_PW_DISPLAY_QSS = {
+    True: """
+            font-family: 'Courier New', monospace;
+            font-size: 14px;
+            font-weight: bold;
+            padding: 10px;
+            border: 2px solid #444;
+            border-radius: 6px;
+            background-color: #2d2d2d;
+            color: #2ECC71;
+        """,
+    False: """
+            font-family: 'Courier New', monospace;
+            font-size: 14px;
+            font-weight: bold;
+            padding: 10px;
+            border: 2px solid #dee2e6;
+            border-radius: 6px;
+            background-color: #f8f9fa;
+            color: #2c3e50;
+        """,
+}
+
+_GEN_STRENGTH_COLORS = {
+    "Very Weak": "#e74c3c",
+    "Weak": "#e67e22",
+    "Moderate": "#f1c40f",
+    "Strong": "#2ecc71",
+    "Very Strong": "#27ae60",
+}
+
+# The entropy label's stylesheet is color-free and set exactly once; the
+# strength color travels in the rich text itself, so a regeneration never
+# touches setStyleSheet (and its QSS reparse) at all
+_GEN_ENTROPY_QSS = """
+            font-size: 12px;
+            padding: 5px;
+        """
+
+
+def _gen_dialog_qss(bg, text, border, groove, handle):
+    return f"""
+            QDialog {{
+                background-color: {bg};
                 border-radius: 10px;
-            }
-            
-            QLabel#strengthLabel {
-                font-size: 12px;
+            }}
+
+            QLabel {{
+                color: {text};
+            }}
+
+            QCheckBox {{
+                color: {text};
+            }}
+
+            QGroupBox {{
                 font-weight: bold;
-                padding: 5px;
-                border-radius: 5px;
-                text-align: center;
-                color: #ffffff;
-            }
-            
-            QLabel#statsLabel {
-                font-size: 12px;
-                color: #b0bec5;
-            }
-            
-            QGroupBox {
-                border: 2px solid #444;
+                border: 2px solid {border};
                 border-radius: 8px;
                 margin-top: 10px;
-                font-weight: bold;
-                color: #ffffff;
-            }
-            
-            QGroupBox::title {
+                padding-top: 10px;
+                color: {text};
+            }}
+
+            QGroupBox::title {{
                 subcontrol-origin: margin;
                 left: 10px;
                 padding: 0 5px 0 5px;
-                color: #ffffff;
-            }
-            
-            QMessageBox {
-                background-color: #1e1e1e;
-            }
-            
-            QMessageBox QLabel {
-                color: #e0e0e0;
-                font-size: 14px;
-            }
-            
-            QMessageBox QPushButton {
-                background-color: #3498db;
-                color: white;
-                padding: 8px 20px;
-                border-radius: 6px;
-                font-weight: bold;
-                min-width: 80px;
-            }
-            
-            QMessageBox QPushButton:hover {
-                background-color: #2980b9;
-            }
-            
-            QMessageBox QPushButton:pressed {
-                background-color: #21618c;
-            }
-            
-            QInputDialog {
-                background-color: #1e1e1e;
-            }
-            
-            QInputDialog QLabel {
-                color: #e0e0e0;
-                font-size: 14px;
-            }
-            
-            QInputDialog QLineEdit {
-                background-color: #2d2d2d;
-                color: #ffffff;
-                border: 2px solid #444;
-                border-radius: 6px;
-                padding: 8px;
-            }
-            
-            QInputDialog QPushButton {
-                background-color: #3498db;
+                color: {text};
+            }}
+
+            QSlider::groove:horizontal {{
+                height: 6px;
+                background: {groove};
+                border-radius: 3px;
+            }}
+
+            QSlider::handle:horizontal {{
+                background: {handle};
+                width: 20px;
+                height: 20px;
+                margin: -7px 0;
+                border-radius: 10px;
+            }}
+
+            QPushButton {{
+                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                    stop: 0 #5DADE2, stop: 1 #2E86C1);
                 color: white;
-                padding: 8px 20px;
+                padding: 10px 20px;
                 border-radius: 6px;
                 font-weight: bold;
-                min-width: 80px;
-            }
-            
-            QInputDialog QPushButton:hover {
-                background-color: #2980b9;
-            }
+                border: none;
+            }}
+
+            QPushButton:hover {{
+                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                    stop: 0 #2E86C1, stop: 1 #1B4965);
+            }}
+            """
+
+
+_GEN_DIALOG_QSS = {
+    True: _gen_dialog_qss("#1e1e1e", "#e0e0e0", "#444", "#444", "#5DADE2")
+    + _GEN_ACTION_BTN_QSS,
+    False: _gen_dialog_qss("white", "#333333", "#dee2e6", "#dee2e6", "#3498db")
+    + _GEN_ACTION_BTN_QSS,
+}
+
+
+def _render_about_html(dark):
+    """Render the About-dialog body for one theme.
+
+    The text is static apart from theme colors, so both variants are built
+    once at startup and reused — QLabel never re-parses the rich text on
+    later opens.
+    """
+    text_color = "#e0e0e0" if dark else "#333333"
+    heading_color = "#3498db" if dark else "#2c3e50"
+    link_color = "#64b5f6" if dark else "#3498db"
+    footer_color = "#b0bec5" if dark else "#7f8c8d"
+
+    return f"""
+        <div style="text-align: center; padding: 10px;">
+            <h3 style="color: {heading_color};">Secure Vault Password Manager</h3>
+            <p style="color: {text_color};"><b>Version:</b> {APP_VERSION}</p>
+            <p style="color: {text_color};"><b>Developer:</b> Daniyal Shahid</p>
+            <p style="color: {text_color};"><b>Email:</b> daniyalpro.dev@gmail.com.com</p>
+            <p style="color: {text_color};"><b>GitHub:</b> <a href="https://github.com/skilldevloper" style="color: {link_color};">github.com/skilldevloper</a></p>
+        </div>
+
+        <div style="margin-top: 20px;">
+            <h4 style="color: {heading_color};">About This Software:</h4>
+            <p style="color: {text_color};">Secure Vault is a robust, secure, and user-friendly password manager designed to keep your credentials safe.</p>
+
+            <h4 style="color: {heading_color};">Key Features:</h4>
+            <ul style="color: {text_color};">
+                <li>Military-grade AES-256 encryption</li>
+                <li>Master password protection</li>
+                <li>Built-in password generator</li>
+                <li>Password strength analyzer</li>
+                <li>Export to encrypted files</li>
+                <li>Export to PDF reports</li>
+                <li>Dark/Light mode</li>
+                <li>Quick search functionality</li>
+                <li>One-click password copying</li>
+            </ul>
+
+            <h4 style="color: {heading_color};">Security Features:</h4>
+            <ul style="color: {text_color};">
+                <li>PBKDF2 key derivation</li>
+                <li>Salted password hashing</li>
+                <li>Encrypted database</li>
+                <li>No internet connection required</li>
+                <li>Local storage only</li>
+            </ul>
+        </div>
+
+        <div style="margin-top: 20px; text-align: center; color: {footer_color};">
+            <p>© 2026 Daniyal Shahid. All rights reserved.</p>
+            <p>This software is provided "as is" without any warranty.</p>
+        </div>
+        """
+
+
+class ButtonIconCache:
+    """Process-wide cache of QIcon instances keyed by logical button name.
+
+    Icons are decoded from disk exactly once per process; every widget that
+    needs an icon goes through get() instead of constructing QIcon(path)
+    itself, so repaints and theme toggles never re-run the PNG decode.
+    """
+
+    _icons = {}
+    _pixmaps = {}
+
+    @classmethod
+    def load(cls, name, path):
+        """Load and cache the icon at path under the given logical name."""
+        if name not in cls._icons:
+            cls._icons[name] = QIcon(path)
+        return cls._icons[name]
+
+    @classmethod
+    def get(cls, name):
+        """Return the cached QIcon for name, or None if not loaded."""
+        return cls._icons.get(name)
+
+    @classmethod
+    def get_pixmap(cls, name, w, h):
+        """
+        Return a QPixmap of the icon scaled to w x h, or None if not loaded.
+
+        QIcon.pixmap() re-runs the smooth scale on every call; fixed-size
+        uses (logo, search glyph) go through this memo instead.
+        """
+        key = (name, w, h)
+        pixmap = cls._pixmaps.get(key)
+        if pixmap is None:
+            icon = cls._icons.get(name)
+            if icon is None:
+                return None
+            pixmap = icon.pixmap(w, h)
+            cls._pixmaps[key] = pixmap
+        return pixmap
+
+
+class EntriesModel(QAbstractTableModel):
+    """Read-only model behind the entries view.
+
+    Each row is a plain tuple of the five display strings plus a muted flag
+    for entries without a service. Compared with a QTableWidget this avoids
+    one heap-allocated item per cell, and data() is only consulted for
+    visible cells.
+    """
+
+    HEADERS = ("ID", "Service", "Username", "Email", "Created")
+
+    _MUTED_FG = QColor("#7f8c8d")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == Qt.ForegroundRole and index.column() == 1:
+            # Gray out the "N/A" placeholder for entries without a service
+            if self._rows[index.row()][5]:
+                return self._MUTED_FG
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def cell(self, row, column):
+        """Plain-Python access to a cell's display string."""
+        return self._rows[row][column]
+
+    def row_entry_id(self, row):
+        """Database id of the entry shown at row."""
+        return self._rows[row][6]
+
+    def set_rows(self, rows):
+        """Swap in a new row list, updating in place when the shape holds.
+
+        A same-length refresh (the common case: re-reading the vault after
+        an edit) emits one dataChanged over the grid instead of a full
+        reset, so the view keeps its selection and scroll position and only
+        repaints cells. Length changes still take the single-reset path.
         """
+        if rows and len(rows) == len(self._rows):
+            self._rows = rows
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(rows) - 1, len(self.HEADERS) - 1),
+            )
+            return
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+
+class PdfExportWorker(QObject):
+    """Builds a PDF report off the GUI thread.
+
+    The worker is moved to a QThread by export_to_pdf; database reads and
+    Fernet decryption are both safe off the main thread (each database call
+    opens its own connection). Progress and completion are reported back via
+    signals so all widget updates stay on the GUI thread.
+    """
+
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(str)
+    error = pyqtSignal(str)
+
+    def __init__(self, gui, file_path, entries):
+        super().__init__()
+        self._gui = gui
+        self._file_path = file_path
+        self._entries = entries
+
+    @pyqtSlot()
+    def run(self):
+        """Generate the report and emit finished or error."""
+        try:
+            self._gui.create_pdf_report(
+                self._file_path, self._entries, self.progress.emit
+            )
+            self.finished.emit(self._file_path)
+        except Exception as e:
+            logger.error(f"Error exporting to PDF: {e}")
+            self.error.emit(str(e))
+
+
+class ImportWorker(QObject):
+    """Runs the import loop off the GUI thread.
+
+    Encrypting and inserting thousands of entries is CPU- and IO-bound;
+    like PdfExportWorker this is moved to a QThread so the progress dialog
+    stays live without processEvents hacks. Cancellation is a plain flag
+    checked between entries.
+    """
+
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(int, int, int)
+    error = pyqtSignal(str)
+
+    def __init__(self, gui, entries, skip_duplicates):
+        super().__init__()
+        self._gui = gui
+        self._entries = entries
+        self._skip_duplicates = skip_duplicates
+        self._cancelled = False
+
+    @pyqtSlot()
+    def cancel(self):
+        self._cancelled = True
+
+    @pyqtSlot()
+    def run(self):
+        """Import the batch and emit finished or error."""
+        try:
+            imported, skipped, failed = self._gui._import_entries(
+                self._entries,
+                self._skip_duplicates,
+                self.progress.emit,
+                lambda: self._cancelled,
+            )
+            self.finished.emit(imported, skipped, failed)
+        except Exception as e:
+            logger.error(f"Error importing passwords: {e}")
+            self.error.emit(str(e))
+
+
+class _EntriesFetchSignals(QObject):
+    """Signal holder for EntriesFetcher (QRunnable cannot emit directly)."""
+
+    finished = pyqtSignal(int, list, list)
+
+
+class EntriesFetcher(QRunnable):
+    """Reads all entries on a pool thread so refreshes never block the UI.
+
+    Rows are built straight off the streaming cursor, so the vault is never
+    held twice (dict list plus row tuples) during a refresh. DatabaseManager
+    opens a fresh connection per call, so the read is safe off the main
+    thread; the generation number lets the GUI discard results from a fetch
+    that was superseded before it finished.
+    """
+
+    def __init__(self, db, generation):
+        super().__init__()
+        self._db = db
+        self._generation = generation
+        self.signals = _EntriesFetchSignals()
+
+    def run(self):
+        rows = []
+        blobs = []
+        try:
+            for i, entry in enumerate(self._db.iter_all_entries()):
+                built = _build_row(
+                    entry["id"],
+                    entry["service"],
+                    entry["username"],
+                    entry["email"],
+                    entry["created_display"],
+                    entry["created_at"],
+                )
+                blobs.append(built[6])
+                rows.append((str(i + 1),) + built[:6])
+        except Exception as e:
+            logger.error(f"Error fetching entries: {e}")
+            rows = []
+            blobs = []
+        self.signals.finished.emit(self._generation, rows, blobs)
+
+
+class PasswordManagerGUI(QMainWindow):
+    """Main GUI application for the password manager using PyQt5."""
+
+    def __init__(self):
+        """Initialize the GUI application."""
+        super().__init__()
+        self.authenticated = False
+        self.current_entry_id = None
+        self.button_images = {}
+        self.dark_mode = False
+        # Lowercased "service\x00username\x00email" per table row, rebuilt on
+        # refresh and scanned by the search filter
+        self._row_blobs = []
+        self._last_search_term = None
+        # About dialog: widgets created on first open and reused after
+        # that; the body HTML is rendered once per theme on demand
+        self._about_html = {}
+        self._about_dialog = None
+        # LRU of recently viewed plaintexts keyed by (entry id, ciphertext);
+        # re-selecting a row skips the Fernet decrypt. Cleared whenever the
+        # key or an entry changes so plaintexts don't outlive their use.
+        self._dec_cache = OrderedDict()
+        self._last_pw_eval = None
+        # Bumped per refresh; a finished fetch only populates the model if
+        # its generation is still the latest
+        self._refresh_generation = 0
+
+        # Initialize managers. The database is needed immediately (first-run
+        # check), but crypto and the generator are built lazily on first use.
+        self.db = DatabaseManager()
+        self._crypto = None
+        self._password_gen = None
+
+        # Load button images
+        self.load_button_images()
+
+        # Setup UI
+        self.init_ui()
+
+        # Check if master password is set
+        self.check_first_run()
+
+    @property
+    def crypto(self):
+        """CryptoManager, constructed on first access (authentication)."""
+        if self._crypto is None:
+            self._crypto = CryptoManager(self.db)
+        return self._crypto
+
+    @property
+    def password_gen(self):
+        """PasswordGenerator, constructed on first access."""
+        if self._password_gen is None:
+            self._password_gen = PasswordGenerator()
+        return self._password_gen
+
+    def load_button_images(self):
+        """Load images for buttons from Images folder."""
+        image_folder = "Images"
+
+        # Map image names to button purposes
+        image_mapping = {
+            "authentication.png": "authenticate",
+            "add.png": "add",
+            "updated.png": "update",
+            "delete.png": "delete",
+            "copy.png": "copy",
+            "generate.png": "generate",
+            "refresh.png": "refresh",
+            "export.png": "export_encrypted",
+            "import.png": "import",
+            "exit.png": "exit",
+            "show.png": "show",
+            "hidden.png": "hide",
+            "Change-password.png": "change_password",
+            "search.png": "search",
+            "about.png": "about",
+            "dark.png": "dark_mode",
+        }
+
+        # One directory scan instead of a stat() per expected image
+        try:
+            with os.scandir(image_folder) as it:
+                present = {e.name: e.path for e in it if e.is_file()}
+        except OSError:
+            present = {}
+
+        # Each icon loads in its own narrow guard so one unreadable file
+        # costs that one icon, not every previously loaded one
+        for image_file, key in image_mapping.items():
+            image_path = present.get(image_file)
+            if not image_path:
+                logger.warning(f"Image not found: {os.path.join(image_folder, image_file)}")
+                continue
+            try:
+                self.button_images[key] = ButtonIconCache.load(key, image_path)
+            except OSError as e:
+                logger.error(f"Error loading image {image_path}: {e}")
+            else:
+                logger.debug(f"Loaded image: {image_path}")
+
+        # Pre-render the fixed sizes the UI is known to use (header logo,
+        # about-dialog logo, search glyph) so the first build of those
+        # widgets reuses a ready pixmap instead of hitting the icon engine
+        ButtonIconCache.get_pixmap("authenticate", 50, 50)
+        ButtonIconCache.get_pixmap("authenticate", 64, 64)
+        ButtonIconCache.get_pixmap("search", 16, 16)
+
+        # Set window icon
+        icon_path = present.get("reset-password.ico")
+        if icon_path:
+            self.setWindowIcon(QIcon(icon_path))
+
+    def init_ui(self):
+        """Initialize the user interface."""
+        self.setWindowTitle(f"{APP_NAME} v{APP_VERSION}")
+        self.setGeometry(100, 100, 1350, 750)
+        self.setMinimumSize(1200, 700)
+
+        # Apply light mode style by default
+        self.apply_light_theme()
+
+        # Create central widget and main layout
+        central_widget, main_layout = _vbox(
+            name="centralWidget", margins=(20, 20, 20, 20), spacing=15
+        )
+        self.setCentralWidget(central_widget)
+
+        # Status bar at top - Header removed as requested
+        status_bar = self.create_status_bar()
+        main_layout.addWidget(status_bar)
+
+        # Main content area
+        content_widget = self.create_content_area()
+        main_layout.addWidget(content_widget, 1)
+
+        # Button panel
+        button_panel = self.create_button_panel()
+        main_layout.addWidget(button_panel)
+
+        # Connect signals
+        self.entries_table.selectionModel().selectionChanged.connect(
+            self.on_entry_select
         )
 
+    def apply_light_theme(self):
+        """Apply light theme stylesheet."""
+        self.setStyleSheet(_theme_qss(False))
+
+    def apply_dark_theme(self):
+        """Apply dark theme stylesheet."""
+        self.setStyleSheet(_theme_qss(True))
+
+    @pyqtSlot()
     def toggle_dark_mode(self):
         """Toggle between light and dark mode."""
         self.dark_mode = not self.dark_mode
@@ -693,69 +1145,41 @@ class PasswordManagerGUI(QMainWindow):
         if self.dark_mode:
             self.apply_dark_theme()
             self.dark_mode_btn.setText("Light Mode")
-            self.dark_mode_btn.setProperty("class", "dark-mode-button")
-            # Update Entry Details title color to white in dark mode
-            if hasattr(self, 'entry_details_title'):
-                self.entry_details_title.setStyleSheet(
-                    """
-                    font-size: 18px;
-                    font-weight: bold;
-                    color: #ffffff;
-                    padding-bottom: 10px;
-                    border-bottom: 2px solid #3498db;
-                """
-                )
-            # Update status label colors for dark mode
-            if hasattr(self, 'status_label'):
-                if self.authenticated:
-                    self.status_label.setStyleSheet("background-color: #27ae60; color: white;")
-                else:
-                    self.status_label.setStyleSheet("background-color: #e74c3c; color: white;")
-            # Update stats label for dark mode
-            if hasattr(self, 'stats_label'):
-                self.stats_label.setStyleSheet("color: #b0bec5; font-size: 12px;")
         else:
             self.apply_light_theme()
             self.dark_mode_btn.setText("Dark Mode")
-            self.dark_mode_btn.setProperty("class", "dark-mode-button")
-            # Update Entry Details title color to dark in light mode
-            if hasattr(self, 'entry_details_title'):
-                self.entry_details_title.setStyleSheet(
-                    """
-                    font-size: 18px;
-                    font-weight: bold;
-                    color: #2c3e50;
-                    padding-bottom: 10px;
-                    border-bottom: 2px solid #3498db;
-                """
-                )
-            # Update status label colors for light mode
-            if hasattr(self, 'status_label'):
-                if self.authenticated:
-                    self.status_label.setStyleSheet("background-color: #27ae60; color: white;")
-                else:
-                    self.status_label.setStyleSheet("background-color: #e74c3c; color: white;")
-            # Update stats label for light mode
-            if hasattr(self, 'stats_label'):
-                self.stats_label.setStyleSheet("color: #7f8c8d; font-size: 12px;")
+        self.dark_mode_btn.setProperty("class", "dark-mode-button")
 
-        # Force style update
-        self.dark_mode_btn.style().polish(self.dark_mode_btn)
-        
-        # Update all buttons to reflect new theme
+        # All three labels are created by init_ui, and the toggle button
+        # itself only exists once init_ui has run, so no existence guards
+        _set_qss_if_changed(
+            self.entry_details_title,
+            _TITLE_DARK_QSS if self.dark_mode else _TITLE_LIGHT_QSS,
+        )
+        # Status colors are auth-keyed, identical in both themes
+        _set_qss_if_changed(
+            self.status_label,
+            _STATUS_OK_QSS if self.authenticated else _STATUS_BAD_QSS,
+        )
+        _set_qss_if_changed(
+            self.stats_label,
+            _STATS_DARK_QSS if self.dark_mode else _STATS_LIGHT_QSS,
+        )
+
+        # Single repolish pass for the buttons whose class property changed;
+        # setStyleSheet() above already restyled every other child widget
         self.update_button_styles()
 
     def create_header(self):
         """Create the header with logo and title."""
-        header = QWidget()
+        header, layout = _hbox(margins=(0, 0, 0, 0))
         header.setFixedHeight(80)
-        layout = QHBoxLayout(header)
-        layout.setContentsMargins(0, 0, 0, 0)
 
         # Logo (using authentication image)
         logo_label = QLabel()
-        if "authenticate" in self.button_images:
-            logo_label.setPixmap(self.button_images["authenticate"].pixmap(50, 50))
+        logo_pixmap = ButtonIconCache.get_pixmap("authenticate", 50, 50)
+        if logo_pixmap:
+            logo_label.setPixmap(logo_pixmap)
         else:
             logo_label.setText("🔐")
             logo_label.setStyleSheet("font-size: 40px;")
@@ -775,22 +1199,16 @@ class PasswordManagerGUI(QMainWindow):
 
     def create_status_bar(self):
         """Create the status bar."""
-        status_bar = QWidget()
+        status_bar, layout = _hbox()
         status_bar.setFixedHeight(40)
-        layout = QHBoxLayout(status_bar)
 
         # Status indicator
-        status_container = QWidget()
+        status_container, status_layout = _hbox(margins=(10, 0, 10, 0))
         status_container.setFixedHeight(30)
-        status_layout = QHBoxLayout(status_container)
-        status_layout.setContentsMargins(10, 0, 10, 0)
 
         self.status_label = QLabel(" Not Authenticated")
         self.status_label.setObjectName("statusLabel")
-        if self.dark_mode:
-            self.status_label.setStyleSheet("background-color: #e74c3c; color: white;")
-        else:
-            self.status_label.setStyleSheet("background-color: #e74c3c; color: white;")
+        self.status_label.setStyleSheet(_STATUS_BAD_QSS)
         status_layout.addWidget(self.status_label)
 
         layout.addWidget(status_container)
@@ -798,10 +1216,7 @@ class PasswordManagerGUI(QMainWindow):
         # Statistics
         stats_label = QLabel()
         stats_label.setObjectName("statsLabel")
-        if self.dark_mode:
-            stats_label.setStyleSheet("color: #b0bec5; font-size: 12px;")
-        else:
-            stats_label.setStyleSheet("color: #7f8c8d; font-size: 12px;")
+        stats_label.setStyleSheet(_STATS_DARK_QSS if self.dark_mode else _STATS_LIGHT_QSS)
         layout.addWidget(stats_label, 1)
         self.stats_label = stats_label
 
@@ -812,9 +1227,7 @@ class PasswordManagerGUI(QMainWindow):
 
     def create_content_area(self):
         """Create the main content area."""
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setSpacing(20)
+        widget, layout = _hbox(spacing=20)
 
         # Left panel - Table
         left_panel = self.create_table_panel()
@@ -828,18 +1241,15 @@ class PasswordManagerGUI(QMainWindow):
 
     def create_table_panel(self):
         """Create the table panel."""
-        panel = QWidget()
-        panel.setObjectName("tablePanel")
-        layout = QVBoxLayout(panel)
+        panel, layout = _vbox(name="tablePanel")
 
         # Search bar
-        search_container = QWidget()
-        search_layout = QHBoxLayout(search_container)
-        search_layout.setContentsMargins(0, 0, 0, 0)
+        search_container, search_layout = _hbox(margins=(0, 0, 0, 0))
 
         search_icon = QLabel()
-        if "search" in self.button_images:
-            search_icon.setPixmap(self.button_images["search"].pixmap(16, 16))
+        search_pixmap = ButtonIconCache.get_pixmap("search", 16, 16)
+        if search_pixmap:
+            search_icon.setPixmap(search_pixmap)
             search_icon.setStyleSheet("padding-right: 5px;")
         else:
             search_icon.setText("🔍")
@@ -848,31 +1258,56 @@ class PasswordManagerGUI(QMainWindow):
 
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search by service, username, or email...")
-        self.search_input.textChanged.connect(self.on_search)
+        # Debounce timer: restarted on every keystroke so a typing burst
+        # results in a single database query
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._run_search)
+        # Hot same-thread signals connect directly, skipping AutoConnection's
+        # per-emit thread check on every keystroke
+        self.search_input.textChanged.connect(self.on_search, Qt.DirectConnection)
+        # Selection debounce: arrow-keying through rows emits a selection
+        # change per step; only the row the user settles on gets decrypted
+        self._select_timer = QTimer(self)
+        self._select_timer.setSingleShot(True)
+        self._select_timer.setInterval(50)
+        self._select_timer.timeout.connect(self._load_selected_entry)
         search_layout.addWidget(self.search_input, 1)
 
         layout.addWidget(search_container)
 
-        # Table
-        self.entries_table = QTableWidget()
-        self.entries_table.setColumnCount(5)
-        self.entries_table.setHorizontalHeaderLabels(
-            ["ID", "Service", "Username", "Email", "Created"]
-        )
+        # Table. Configure it fully with updates disabled so the header and
+        # column setup below costs one geometry pass instead of one per call.
+        self.entries_model = EntriesModel(self)
+        self.entries_table = QTableView()
+        self.entries_table.setUpdatesEnabled(False)
+        self.entries_table.setModel(self.entries_model)
         self.entries_table.setAlternatingRowColors(True)
-        self.entries_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.entries_table.setSelectionMode(QTableWidget.SingleSelection)
-        self.entries_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.entries_table.horizontalHeader().setStretchLastSection(True)
-        self.entries_table.horizontalHeader().setSectionResizeMode(
-            QHeaderView.Interactive
-        )
+        self.entries_table.setSelectionBehavior(QTableView.SelectRows)
+        self.entries_table.setSelectionMode(QTableView.SingleSelection)
+        self.entries_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.entries_table.setVerticalScrollMode(QTableView.ScrollPerPixel)
+
+        # Every row renders with the same font and padding, so pin the row
+        # height once; the view then skips per-row sizeHint queries when
+        # scrolling (QTableView's analogue of setUniformRowHeights)
+        self.entries_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+
+        header = self.entries_table.horizontalHeader()
+        header.blockSignals(True)
+        header.setStretchLastSection(True)
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        # The ID column is a fixed-width ordinal; the rest stay draggable
+        header.setSectionResizeMode(0, QHeaderView.Fixed)
 
         # Set column widths
         self.entries_table.setColumnWidth(0, 50)
         self.entries_table.setColumnWidth(1, 200)
         self.entries_table.setColumnWidth(2, 180)
         self.entries_table.setColumnWidth(3, 200)
+        header.blockSignals(False)
+        self.entries_table.setUpdatesEnabled(True)
 
         layout.addWidget(self.entries_table, 1)
 
@@ -880,74 +1315,79 @@ class PasswordManagerGUI(QMainWindow):
 
     def create_details_panel(self):
         """Create the details panel."""
-        panel = QWidget()
-        panel.setObjectName("detailsPanel")
-        layout = QVBoxLayout(panel)
+        panel, layout = _vbox(name="detailsPanel")
 
         # Panel title
         self.entry_details_title = QLabel("Entry Details")
-        title_color = "#ffffff" if self.dark_mode else "#2c3e50"
         self.entry_details_title.setStyleSheet(
-            f"""
-            font-size: 18px;
-            font-weight: bold;
-            color: {title_color};
-            padding-bottom: 10px;
-            border-bottom: 2px solid #3498db;
-        """
+            _TITLE_DARK_QSS if self.dark_mode else _TITLE_LIGHT_QSS
         )
         layout.addWidget(self.entry_details_title)
 
-        # Form layout - CHANGED: Labels aligned to left
-        form_layout = QFormLayout()
-        form_layout.setLabelAlignment(
-            Qt.AlignLeft
-        )  # Changed from AlignRight to AlignLeft
+        # Fixed grid instead of QFormLayout: the form never gains rows at
+        # runtime, and the grid computes row geometry without QFormLayout's
+        # per-pass bookkeeping. Labels left-aligned as before.
+        form_layout = QGridLayout()
         form_layout.setSpacing(15)
         form_layout.setContentsMargins(10, 20, 10, 10)
+        form_layout.setColumnStretch(1, 1)
+        _label_align = Qt.AlignLeft | Qt.AlignVCenter
 
         # Service
         self.service_input = QLineEdit()
         self.service_input.setPlaceholderText("e.g., Google, Facebook")
-        form_layout.addRow("Service:", self.service_input)
+        form_layout.addWidget(QLabel("Service:"), 0, 0, _label_align)
+        form_layout.addWidget(self.service_input, 0, 1)
 
         # Username
         self.username_input = QLineEdit()
         self.username_input.setPlaceholderText("Username or email")
-        form_layout.addRow("Username:", self.username_input)
+        form_layout.addWidget(QLabel("Username:"), 1, 0, _label_align)
+        form_layout.addWidget(self.username_input, 1, 1)
 
         # Email
         self.email_input = QLineEdit()
         self.email_input.setPlaceholderText("Optional email")
-        form_layout.addRow("Email:", self.email_input)
+        form_layout.addWidget(QLabel("Email:"), 2, 0, _label_align)
+        form_layout.addWidget(self.email_input, 2, 1)
 
         # Password
-        password_container = QWidget()
-        password_layout = QHBoxLayout(password_container)
-        password_layout.setContentsMargins(0, 0, 0, 0)
+        password_container, password_layout = _hbox(margins=(0, 0, 0, 0))
 
         self.password_input = QLineEdit()
         self.password_input.setEchoMode(QLineEdit.Password)
-        self.password_input.textChanged.connect(self.update_strength_indicator)
+        # Strength debounce: entropy evaluation and label restyle run once
+        # per typing burst rather than on every keystroke
+        self._strength_timer = QTimer(self)
+        self._strength_timer.setSingleShot(True)
+        self._strength_timer.setInterval(120)
+        self._strength_timer.timeout.connect(self._apply_strength)
+        self.password_input.textChanged.connect(
+            self.update_strength_indicator, Qt.DirectConnection
+        )
         password_layout.addWidget(self.password_input, 1)
 
         # Show/Hide button
         self.show_password_btn = QPushButton()
-        if "show" in self.button_images:
-            self.show_password_btn.setIcon(self.button_images["show"])
+        show_icon = ButtonIconCache.get("show")
+        if show_icon:
+            self.show_password_btn.setIcon(show_icon)
             self.show_password_btn.setToolTip("Show Password")
         else:
             self.show_password_btn.setText("👁")
             self.show_password_btn.setToolTip("Show Password")
         self.show_password_btn.setCheckable(True)
         self.show_password_btn.setFixedWidth(40)
-        self.show_password_btn.toggled.connect(self.toggle_password_visibility)
+        self.show_password_btn.toggled.connect(
+            self.toggle_password_visibility, Qt.DirectConnection
+        )
         password_layout.addWidget(self.show_password_btn)
 
         # Copy button
         copy_btn = QPushButton()
-        if "copy" in self.button_images:
-            copy_btn.setIcon(self.button_images["copy"])
+        copy_icon = ButtonIconCache.get("copy")
+        if copy_icon:
+            copy_btn.setIcon(copy_icon)
             copy_btn.setToolTip("Copy Password")
         else:
             copy_btn.setText("📋")
@@ -956,12 +1396,11 @@ class PasswordManagerGUI(QMainWindow):
         copy_btn.clicked.connect(self.copy_password)
         password_layout.addWidget(copy_btn)
 
-        form_layout.addRow("Password:", password_container)
+        form_layout.addWidget(QLabel("Password:"), 3, 0, _label_align)
+        form_layout.addWidget(password_container, 3, 1)
 
         # Strength indicator
-        strength_container = QWidget()
-        strength_layout = QHBoxLayout(strength_container)
-        strength_layout.setContentsMargins(0, 0, 0, 0)
+        strength_container, strength_layout = _hbox(margins=(0, 0, 0, 0))
 
         self.strength_label = QLabel()
         self.strength_label.setObjectName("strengthLabel")
@@ -969,7 +1408,8 @@ class PasswordManagerGUI(QMainWindow):
         self.strength_label.setMinimumHeight(25)
         strength_layout.addWidget(self.strength_label)
 
-        form_layout.addRow("Strength:", strength_container)
+        form_layout.addWidget(QLabel("Strength:"), 4, 0, _label_align)
+        form_layout.addWidget(strength_container, 4, 1)
 
         # Notes
         notes_label = QLabel("Notes:")
@@ -977,7 +1417,8 @@ class PasswordManagerGUI(QMainWindow):
         self.notes_input = QTextEdit()
         self.notes_input.setMaximumHeight(120)
         self.notes_input.setPlaceholderText("Add optional notes...")
-        form_layout.addRow(notes_label, self.notes_input)
+        form_layout.addWidget(notes_label, 5, 0, Qt.AlignLeft | Qt.AlignTop)
+        form_layout.addWidget(self.notes_input, 5, 1)
 
         layout.addLayout(form_layout)
         layout.addStretch(1)
@@ -986,11 +1427,8 @@ class PasswordManagerGUI(QMainWindow):
 
     def create_button_panel(self):
         """Create the button panel."""
-        panel = QWidget()
+        panel, layout = _vbox(margins=(5, 5, 5, 5), spacing=8)
         panel.setFixedHeight(160)
-        layout = QVBoxLayout(panel)
-        layout.setSpacing(8)
-        layout.setContentsMargins(5, 5, 5, 5)
 
         # Create two rows of buttons
         row1 = QHBoxLayout()
@@ -1030,6 +1468,7 @@ class PasswordManagerGUI(QMainWindow):
             btn = self.create_button(text, slot, style, image_key)
             if text == "Dark Mode":
                 self.dark_mode_btn = btn
+                self._themed_buttons = [btn]
             row2.addWidget(btn)
 
         layout.addLayout(row1)
@@ -1042,8 +1481,9 @@ class PasswordManagerGUI(QMainWindow):
         btn = QPushButton(text)
         btn.setProperty("class", style)
 
-        if image_key and image_key in self.button_images:
-            btn.setIcon(self.button_images[image_key])
+        icon = ButtonIconCache.get(image_key) if image_key else None
+        if icon:
+            btn.setIcon(icon)
             btn.setIconSize(QSize(22, 22))
 
         btn.clicked.connect(slot)
@@ -1059,13 +1499,14 @@ class PasswordManagerGUI(QMainWindow):
         return btn
     
     def update_button_styles(self):
-        """Update all button styles when theme changes."""
-        # Buttons are styled via the main stylesheet, so we just need to refresh
-        if hasattr(self, '_button_widgets'):
-            for btn in self._button_widgets:
-                btn.style().unpolish(btn)
-                btn.style().polish(btn)
-                btn.update()
+        """Refresh the buttons whose styling depends on the theme."""
+        # setStyleSheet() on the window already re-polishes every child; only
+        # the dark-mode button swaps its gradient between themes and needs an
+        # explicit refresh instead of walking the full widget list.
+        for btn in getattr(self, '_themed_buttons', []):
+            btn.style().unpolish(btn)
+            btn.style().polish(btn)
+            btn.update()
 
     def update_statistics(self):
         """Update statistics display."""
@@ -1077,105 +1518,74 @@ class PasswordManagerGUI(QMainWindow):
             logger.error(f"Error updating statistics: {e}")
             self.stats_label.setText(" Statistics: N/A")
 
+    @pyqtSlot()
     def show_about(self):
         """Show about dialog with application information."""
-        about_dialog = QDialog(self)
-        about_dialog.setWindowTitle("About Secure Vault")
-        about_dialog.setMinimumWidth(500)
-        about_dialog.setMinimumHeight(400)
-
-        layout = QVBoxLayout(about_dialog)
-
-        # Header with logo
-        header_layout = QHBoxLayout()
-
-        # Logo
-        logo_label = QLabel()
-        if "authenticate" in self.button_images:
-            logo_label.setPixmap(self.button_images["authenticate"].pixmap(64, 64))
-        else:
-            logo_label.setText("🔐")
-            logo_label.setStyleSheet("font-size: 48px;")
-        header_layout.addWidget(logo_label)
-
-        # Title
-        title_label = QLabel(APP_NAME)
-        title_label.setStyleSheet(
-            """
-            font-size: 24px;
-            font-weight: bold;
-            color: #2c3e50;
-        """
+        if self._about_dialog is None:
+            self._build_about_dialog()
+
+        # Swap in the cached HTML for the current theme; everything else
+        # in the dialog is theme-independent
+        html = self._about_html.get(self.dark_mode)
+        if html is None:
+            html = self._about_html[self.dark_mode] = _render_about_html(self.dark_mode)
+        self._about_label.setText(html)
+        _set_qss_if_changed(
+            self._about_label,
+            "background-color: #1e1e1e; padding: 10px;"
+            if self.dark_mode
+            else "background-color: white; padding: 10px;",
         )
-        header_layout.addWidget(title_label, 1)
-
-        layout.addLayout(header_layout)
-
-        # Separator
-        separator = QFrame()
-        separator.setFrameShape(QFrame.HLine)
-        separator.setFrameShadow(QFrame.Sunken)
-        separator.setStyleSheet("background-color: #3498db; height: 2px;")
-        layout.addWidget(separator)
+        self._about_dialog.exec_()
 
-        # Application info - Color based on theme
-        text_color = "#333333" if not self.dark_mode else "#e0e0e0"
-        heading_color = "#2c3e50" if not self.dark_mode else "#3498db"
-        link_color = "#3498db" if not self.dark_mode else "#64b5f6"
-        footer_color = "#7f8c8d" if not self.dark_mode else "#b0bec5"
-        
-        info_text = f"""
-        <div style="text-align: center; padding: 10px;">
-            <h3 style="color: {heading_color};">Secure Vault Password Manager</h3>
-            <p style="color: {text_color};"><b>Version:</b> {APP_VERSION}</p>
-            <p style="color: {text_color};"><b>Developer:</b> Daniyal Shahid</p>
-            <p style="color: {text_color};"><b>Email:</b> daniyalpro.dev@gmail.com.com</p>
-            <p style="color: {text_color};"><b>GitHub:</b> <a href="https://github.com/skilldevloper" style="color: {link_color};">github.com/skilldevloper</a></p>
-        </div>
-        
-        <div style="margin-top: 20px;">
-            <h4 style="color: {heading_color};">About This Software:</h4>
-            <p style="color: {text_color};">Secure Vault is a robust, secure, and user-friendly password manager designed to keep your credentials safe.</p>
-            
-            <h4 style="color: {heading_color};">Key Features:</h4>
-            <ul style="color: {text_color};">
-                <li>Military-grade AES-256 encryption</li>
-                <li>Master password protection</li>
-                <li>Built-in password generator</li>
-                <li>Password strength analyzer</li>
-                <li>Export to encrypted files</li>
-                <li>Export to PDF reports</li>
-                <li>Dark/Light mode</li>
-                <li>Quick search functionality</li>
-                <li>One-click password copying</li>
-            </ul>
-            
-            <h4 style="color: {heading_color};">Security Features:</h4>
-            <ul style="color: {text_color};">
-                <li>PBKDF2 key derivation</li>
-                <li>Salted password hashing</li>
-                <li>Encrypted database</li>
-                <li>No internet connection required</li>
-                <li>Local storage only</li>
-            </ul>
-        </div>
-        
-        <div style="margin-top: 20px; text-align: center; color: {footer_color};">
-            <p>© 2026 Daniyal Shahid. All rights reserved.</p>
-            <p>This software is provided "as is" without any warranty.</p>
-        </div>
+    def _build_about_dialog(self):
+        """Construct the About dialog once; show_about reuses it."""
+        about_dialog = QDialog(self)
+        about_dialog.setWindowTitle("About Secure Vault")
+        about_dialog.setMinimumWidth(500)
+        about_dialog.setMinimumHeight(400)
+
+        layout = QVBoxLayout(about_dialog)
+
+        # Header with logo
+        header_layout = QHBoxLayout()
+
+        # Logo
+        logo_label = QLabel()
+        logo_pixmap = ButtonIconCache.get_pixmap("authenticate", 64, 64)
+        if logo_pixmap:
+            logo_label.setPixmap(logo_pixmap)
+        else:
+            logo_label.setText("🔐")
+            logo_label.setStyleSheet("font-size: 48px;")
+        header_layout.addWidget(logo_label)
+
+        # Title
+        title_label = QLabel(APP_NAME)
+        title_label.setStyleSheet(
+            """
+            font-size: 24px;
+            font-weight: bold;
+            color: #2c3e50;
         """
+        )
+        header_layout.addWidget(title_label, 1)
+
+        layout.addLayout(header_layout)
+
+        # Separator
+        separator = QFrame()
+        separator.setFrameShape(QFrame.HLine)
+        separator.setFrameShadow(QFrame.Sunken)
+        separator.setStyleSheet("background-color: #3498db; height: 2px;")
+        layout.addWidget(separator)
 
-        info_label = QLabel(info_text)
+        # Body text is filled in by show_about from the per-theme cache
+        info_label = QLabel()
         info_label.setTextFormat(Qt.RichText)
         info_label.setTextInteractionFlags(Qt.TextBrowserInteraction)
         info_label.setOpenExternalLinks(True)
         info_label.setWordWrap(True)
-        # Set background color based on theme
-        if self.dark_mode:
-            info_label.setStyleSheet("background-color: #1e1e1e; padding: 10px;")
-        else:
-            info_label.setStyleSheet("background-color: white; padding: 10px;")
 
         scroll_area = QScrollArea()
         scroll_area.setWidget(info_label)
@@ -1208,7 +1618,8 @@ class PasswordManagerGUI(QMainWindow):
         button_layout.addStretch()
         layout.addLayout(button_layout)
 
-        about_dialog.exec_()
+        self._about_dialog = about_dialog
+        self._about_label = info_label
 
     # ===== CORE FUNCTIONALITY METHODS =====
 
@@ -1277,9 +1688,7 @@ class PasswordManagerGUI(QMainWindow):
             if self.crypto.initialize_master_password(password):
                 self.authenticated = True
                 self.status_label.setText("Authenticated")
-                self.status_label.setStyleSheet(
-                    "background-color: #27ae60; color: white;"
-                )
+                self.status_label.setStyleSheet(_STATUS_OK_QSS)
                 self.statusBar().showMessage("Authenticated")
                 self.refresh_entries()
                 QMessageBox.information(
@@ -1291,6 +1700,7 @@ class PasswordManagerGUI(QMainWindow):
                 self.close()
                 return
 
+    @pyqtSlot()
     def authenticate(self):
         """Authenticate with master password."""
         if self.authenticated:
@@ -1306,14 +1716,16 @@ class PasswordManagerGUI(QMainWindow):
 
         if self.crypto.authenticate(password):
             self.authenticated = True
+            self._dec_cache.clear()
             self.status_label.setText("Authenticated")
-            self.status_label.setStyleSheet("background-color: #27ae60; color: white;")
+            self.status_label.setStyleSheet(_STATUS_OK_QSS)
             self.statusBar().showMessage("Authenticated")
             self.refresh_entries()
             QMessageBox.information(self, "Success", "Authentication successful!")
         else:
             QMessageBox.critical(self, "Error", "Authentication failed!")
 
+    @pyqtSlot()
     def add_entry(self):
         """Add a new password entry."""
         if not self.authenticated:
@@ -1334,31 +1746,47 @@ class PasswordManagerGUI(QMainWindow):
 
         if not password:
             # Generate password if empty
-            password = self.password_gen.generate_password()
+            password = _pg_generate()
             self.password_input.setText(password)
-            self.update_strength_indicator()
-
-        # Check if entry already exists
-        if self.db.entry_exists(service if service else None, username):
-            reply = QMessageBox.question(
-                self,
-                "Confirm",
-                "Entry already exists. Overwrite?",
-                QMessageBox.Yes | QMessageBox.No,
-            )
-            if reply == QMessageBox.No:
-                return
+            self._apply_strength()
 
-        # Encrypt and save
+        # Encrypt and save. The unique (service, username) index makes the
+        # insert itself the duplicate check, so the common non-duplicate
+        # add costs one database call and can't race a concurrent insert.
         try:
             encrypted_password = self.crypto.encrypt_password(password)
-            if self.db.add_entry(
-                service if service else None,
-                username,
-                encrypted_password,
-                email if email else None,
-                notes if notes else None,
-            ):
+            try:
+                added = self.db.add_entry(
+                    service if service else None,
+                    username,
+                    encrypted_password,
+                    email if email else None,
+                    notes if notes else None,
+                )
+            except sqlite3.IntegrityError:
+                reply = QMessageBox.question(
+                    self,
+                    "Confirm",
+                    "Entry already exists. Overwrite?",
+                    QMessageBox.Yes | QMessageBox.No,
+                )
+                if reply == QMessageBox.No:
+                    return
+                existing_id = self.db.get_entry_id(
+                    service if service else None, username
+                )
+                added = existing_id is not None and self.db.update_entry(
+                    existing_id,
+                    service if service else None,
+                    username,
+                    encrypted_password,
+                    email if email else None,
+                    notes if notes else None,
+                )
+                if added:
+                    for key in [k for k in self._dec_cache if k[0] == existing_id]:
+                        del self._dec_cache[key]
+            if added:
                 QMessageBox.information(self, "Success", "Entry added successfully!")
                 self.clear_entry_fields()
                 self.refresh_entries()
@@ -1369,26 +1797,20 @@ class PasswordManagerGUI(QMainWindow):
             logger.error(f"Error adding entry: {e}")
             QMessageBox.critical(self, "Error", f"Failed to add entry: {str(e)}")
 
+    @pyqtSlot()
     def update_entry(self):
         """Update selected entry."""
         if not self.authenticated:
             QMessageBox.critical(self, "Error", "Please authenticate first.")
             return
 
-        selected_rows = self.entries_table.selectedItems()
-        if not selected_rows:
+        row = self._selected_row()
+        if row is None:
             QMessageBox.critical(self, "Error", "No entry selected.")
             return
 
-        # Get display ID from first column of selected row
-        row = selected_rows[0].row()
-        display_id = int(self.entries_table.item(row, 0).text())
-
-        # Get actual ID from mapping
-        actual_id = self.id_mapping.get(display_id)
-        if not actual_id:
-            QMessageBox.critical(self, "Error", "Invalid entry selected.")
-            return
+        # The model carries the database id alongside the display columns
+        actual_id = self.entries_model.row_entry_id(row)
 
         # Get current values
         service = self.service_input.text().strip()
@@ -1418,6 +1840,8 @@ class PasswordManagerGUI(QMainWindow):
                 notes if notes else None,
             ):
                 QMessageBox.information(self, "Success", "Entry updated successfully!")
+                for key in [k for k in self._dec_cache if k[0] == actual_id]:
+                    del self._dec_cache[key]
                 self.refresh_entries()
                 self.update_statistics()
             else:
@@ -1426,28 +1850,22 @@ class PasswordManagerGUI(QMainWindow):
             logger.error(f"Error updating entry: {e}")
             QMessageBox.critical(self, "Error", f"Failed to update entry: {str(e)}")
 
+    @pyqtSlot()
     def delete_entry(self):
         """Delete selected entry."""
         if not self.authenticated:
             QMessageBox.critical(self, "Error", "Please authenticate first.")
             return
 
-        selected_rows = self.entries_table.selectedItems()
-        if not selected_rows:
+        row = self._selected_row()
+        if row is None:
             QMessageBox.critical(self, "Error", "No entry selected.")
             return
 
         # Get entry info for confirmation
-        row = selected_rows[0].row()
-        service = self.entries_table.item(row, 1).text()
-        username = self.entries_table.item(row, 2).text()
-        display_id = int(self.entries_table.item(row, 0).text())
-
-        # Get actual ID from mapping
-        actual_id = self.id_mapping.get(display_id)
-        if not actual_id:
-            QMessageBox.critical(self, "Error", "Invalid entry selected.")
-            return
+        service = self.entries_model.cell(row, 1)
+        username = self.entries_model.cell(row, 2)
+        actual_id = self.entries_model.row_entry_id(row)
 
         # Confirm deletion
         confirm_msg = f"Delete entry for {username}"
@@ -1462,12 +1880,15 @@ class PasswordManagerGUI(QMainWindow):
         if reply == QMessageBox.Yes:
             if self.db.delete_entry(actual_id):
                 QMessageBox.information(self, "Success", "Entry deleted successfully!")
+                for key in [k for k in self._dec_cache if k[0] == actual_id]:
+                    del self._dec_cache[key]
                 self.clear_entry_fields()
                 self.refresh_entries()
                 self.update_statistics()
             else:
                 QMessageBox.critical(self, "Error", "Failed to delete entry.")
 
+    @pyqtSlot()
     def copy_password(self):
         """Copy password to clipboard."""
         if not self.authenticated:
@@ -1480,148 +1901,166 @@ class PasswordManagerGUI(QMainWindow):
             return
 
         try:
-            pyperclip.copy(password)
+            _copy_to_clipboard(password)
             QMessageBox.information(self, "Success", "Password copied to clipboard!")
         except Exception as e:
             logger.error(f"Error copying to clipboard: {e}")
             QMessageBox.critical(self, "Error", f"Failed to copy: {str(e)}")
 
+    @pyqtSlot()
     def show_generator(self):
         """Show password generator dialog."""
-        dialog = PasswordGeneratorDialog(self, self.password_gen, self.button_images)
-        # Update dialog dark mode state
-        dialog.dark_mode = self.dark_mode
-        if self.dark_mode:
-            dialog.apply_dark_theme()
+        # Build the dialog once and reuse it: reopening only costs a fresh
+        # password draw, not QSS parsing and widget construction
+        dialog = getattr(self, "_pw_dialog", None)
+        if dialog is None:
+            dialog = PasswordGeneratorDialog(self, self.password_gen, self.button_images)
+            self._pw_dialog = dialog
         else:
-            dialog.apply_light_theme()
+            dialog.generated_password = None
+            dialog.generate_password()
+        # Update dialog dark mode state
+        if dialog.dark_mode != self.dark_mode:
+            if self.dark_mode:
+                dialog.apply_dark_theme()
+            else:
+                dialog.apply_light_theme()
         if dialog.exec_() == QDialog.Accepted and dialog.generated_password:
             self.password_input.setText(dialog.generated_password)
-            self.update_strength_indicator()
+            self._apply_strength()
 
+    @pyqtSlot()
     def refresh_entries(self):
         """Refresh the entries list with sequential IDs."""
         if not self.authenticated:
-            self.entries_table.setRowCount(0)
+            self.entries_model.set_rows([])
             return
 
-        # Clear current items
-        self.entries_table.setRowCount(0)
-        self.id_mapping.clear()
-
-        # Get all entries
-        entries = self.db.get_all_entries()
+        # Read on the pool so the event loop stays live on large vaults; a
+        # newer refresh supersedes any fetch still in flight
+        self._refresh_generation += 1
+        fetcher = EntriesFetcher(self.db, self._refresh_generation)
+        fetcher.signals.finished.connect(self._populate_entries)
+        self._entries_fetcher = fetcher
+        QThreadPool.globalInstance().start(fetcher)
+
+    @pyqtSlot(int, list, list)
+    def _populate_entries(self, generation, rows, blobs):
+        """Fill the model from a finished fetch, unless it went stale."""
+        if generation != self._refresh_generation:
+            return
 
-        # Set row count
-        self.entries_table.setRowCount(len(entries))
+        self._row_blobs = blobs
 
-        # Display with sequential numbering
-        for i, entry in enumerate(entries):
-            # Store mapping (display ID -> actual ID)
-            display_id = i + 1
-            self.id_mapping[display_id] = entry["id"]
+        # One model reset repaints the view once, however many rows changed
+        self.entries_model.set_rows(rows)
 
-            # Format date in readable format
-            try:
-                created_date = datetime.fromisoformat(entry["created_at"])
-                formatted_date = created_date.strftime("%d %B %Y, %I:%M %p")
-            except:
-                formatted_date = entry["created_at"]
-
-            # Add items to table with styling
-            self.entries_table.setItem(i, 0, QTableWidgetItem(str(display_id)))
-            self.entries_table.setItem(
-                i, 1, QTableWidgetItem(entry["service"] or "N/A")
-            )
-            self.entries_table.setItem(i, 2, QTableWidgetItem(entry["username"]))
-            self.entries_table.setItem(i, 3, QTableWidgetItem(entry["email"] or "N/A"))
-            self.entries_table.setItem(i, 4, QTableWidgetItem(formatted_date))
+        # Keep an active search filter applied across refreshes (a reset
+        # leaves every row visible, so an empty term needs no pass)
+        search_term = self.search_input.text().strip().lower()
+        if search_term:
+            self._apply_search_filter(search_term)
+        else:
+            self._last_search_term = ""
 
-            # Color code based on service availability
-            if not entry["service"]:
-                self.entries_table.item(i, 1).setForeground(QColor("#7f8c8d"))
+    def _selected_row(self):
+        """Return the index of the selected table row, or None."""
+        indexes = self.entries_table.selectionModel().selectedRows()
+        return indexes[0].row() if indexes else None
 
+    @pyqtSlot()
     def on_entry_select(self):
-        """Handle entry selection in table."""
+        """Debounce selection changes during rapid keyboard navigation."""
         if not self.authenticated:
             return
+        self._select_timer.start()
 
-        selected_rows = self.entries_table.selectedItems()
-        if not selected_rows:
+    @pyqtSlot()
+    def _load_selected_entry(self):
+        """Load and decrypt the entry the selection settled on."""
+        if not self.authenticated:
             return
 
-        # Get display ID from first column of selected row
-        row = selected_rows[0].row()
-        display_id = int(self.entries_table.item(row, 0).text())
-
-        # Get actual ID from mapping
-        actual_id = self.id_mapping.get(display_id)
-        if not actual_id:
+        row = self._selected_row()
+        if row is None:
             return
 
+        actual_id = self.entries_model.row_entry_id(row)
+
         # Get entry from database
         entry = self.db.get_entry(actual_id)
         if entry:
-            # Decrypt password
+            # Decrypt password, reusing the plaintext if this entry was
+            # viewed recently and its ciphertext hasn't changed
             try:
-                decrypted_password = self.crypto.decrypt_password(entry["password"])
+                cache_key = (actual_id, entry["password"])
+                decrypted_password = self._dec_cache.get(cache_key)
+                if decrypted_password is None:
+                    decrypted_password = self.crypto.decrypt_password(
+                        entry["password"]
+                    )
+                    self._dec_cache[cache_key] = decrypted_password
+                    if len(self._dec_cache) > _DEC_CACHE_MAX:
+                        self._dec_cache.popitem(last=False)
+                else:
+                    self._dec_cache.move_to_end(cache_key)
                 self.service_input.setText(entry["service"] or "")
                 self.username_input.setText(entry["username"])
                 self.email_input.setText(entry["email"] or "")
                 self.password_input.setText(decrypted_password)
                 self.notes_input.setPlainText(entry["notes"] or "")
-                self.update_strength_indicator()
+                self._apply_strength()
             except Exception as e:
                 logger.error(f"Error decrypting password: {e}")
                 QMessageBox.critical(self, "Error", "Failed to decrypt password.")
                 self.clear_entry_fields()
 
+    @pyqtSlot()
     def on_search(self):
-        """Handle search functionality."""
+        """Debounce search input so rapid typing collapses into one query."""
         if not self.authenticated:
             return
+        self._search_timer.start()
 
+    @pyqtSlot()
+    def _run_search(self):
+        """Apply the pending search by toggling row visibility."""
+        if not self.authenticated:
+            return
         search_term = self.search_input.text().strip().lower()
-
-        if not search_term:
-            # Show all entries if search is empty
-            self.refresh_entries()
+        # Edits that don't change the effective term (added whitespace,
+        # case changes) land here too; skip the rescan for those
+        if search_term == self._last_search_term:
             return
+        self._apply_search_filter(search_term)
 
-        # Get all entries
-        all_entries = self.db.get_all_entries()
-        filtered_entries = []
-
-        for entry in all_entries:
-            if (
-                search_term in (entry["service"] or "").lower()
-                or search_term in entry["username"].lower()
-                or search_term in (entry["email"] or "").lower()
-            ):
-                filtered_entries.append(entry)
-
-        # Display filtered entries
-        self.entries_table.setRowCount(len(filtered_entries))
-        self.id_mapping.clear()
-
-        for i, entry in enumerate(filtered_entries):
-            display_id = i + 1
-            self.id_mapping[display_id] = entry["id"]
+    def _apply_search_filter(self, search_term):
+        """
+        Hide rows whose cached text blob doesn't contain search_term.
 
-            # Format date in readable format
-            try:
-                created_date = datetime.fromisoformat(entry["created_at"])
-                formatted_date = created_date.strftime("%d %B %Y, %I:%M %p")
-            except:
-                formatted_date = entry["created_at"]
-
-            self.entries_table.setItem(i, 0, QTableWidgetItem(str(display_id)))
-            self.entries_table.setItem(
-                i, 1, QTableWidgetItem(entry["service"] or "N/A")
-            )
-            self.entries_table.setItem(i, 2, QTableWidgetItem(entry["username"]))
-            self.entries_table.setItem(i, 3, QTableWidgetItem(entry["email"] or "N/A"))
-            self.entries_table.setItem(i, 4, QTableWidgetItem(formatted_date))
+        The model stays fully populated; filtering flips hidden flags on the
+        view, so a keystroke costs N substring checks instead of a model
+        rebuild.
+        """
+        self._last_search_term = search_term
+        table = self.entries_table
+        # Suspend only the viewport: the header and scroll bars don't need
+        # repainting while hidden flags flip, and the viewport repaints once
+        # on re-enable
+        viewport = table.viewport()
+        viewport.setUpdatesEnabled(False)
+        # Bind the method once; the loop body is then one C call plus one
+        # C-level substring check per row
+        set_hidden = table.setRowHidden
+        try:
+            if search_term:
+                for row, blob in enumerate(self._row_blobs):
+                    set_hidden(row, search_term not in blob)
+            else:
+                for row in range(len(self._row_blobs)):
+                    set_hidden(row, False)
+        finally:
+            viewport.setUpdatesEnabled(True)
 
     def clear_entry_fields(self):
         """Clear all entry fields."""
@@ -1633,57 +2072,57 @@ class PasswordManagerGUI(QMainWindow):
         self.strength_label.clear()
         self.strength_label.setStyleSheet("")
 
+    @pyqtSlot(bool)
     def toggle_password_visibility(self, checked):
         """Toggle password visibility."""
         if checked:
             self.password_input.setEchoMode(QLineEdit.Normal)
-            if "hide" in self.button_images:
-                self.show_password_btn.setIcon(self.button_images["hide"])
+            hide_icon = ButtonIconCache.get("hide")
+            if hide_icon:
+                self.show_password_btn.setIcon(hide_icon)
                 self.show_password_btn.setToolTip("Hide Password")
             else:
                 self.show_password_btn.setText("")
                 self.show_password_btn.setToolTip("Hide Password")
         else:
             self.password_input.setEchoMode(QLineEdit.Password)
-            if "show" in self.button_images:
-                self.show_password_btn.setIcon(self.button_images["show"])
+            show_icon = ButtonIconCache.get("show")
+            if show_icon:
+                self.show_password_btn.setIcon(show_icon)
                 self.show_password_btn.setToolTip("Show Password")
             else:
                 self.show_password_btn.setText("")
                 self.show_password_btn.setToolTip("Show Password")
 
+    @pyqtSlot()
     def update_strength_indicator(self):
-        """Update password strength indicator."""
+        """Debounce strength evaluation while the password is being typed."""
+        self._strength_timer.start()
+
+    @pyqtSlot()
+    def _apply_strength(self):
+        """Evaluate the pending password and restyle the indicator."""
         password = self.password_input.text()
+        if password == self._last_pw_eval:
+            return
+        self._last_pw_eval = password
         if password:
-            evaluation = self.password_gen.evaluate_strength(password)
-
-            color_map = {
-                "Very Weak": ("#e74c3c", ""),
-                "Weak": ("#e67e22", ""),
-                "Moderate": ("#f1c40f", ""),
-                "Strong": ("#2ecc71", ""),
-                "Very Strong": ("#27ae60", ""),
-            }
+            evaluation = _pg_evaluate(password)
+            strength = evaluation["strength"]
 
-            color, icon = color_map.get(evaluation["strength"], ("#333", ""))
-            strength_text = (
-                f"{icon} {evaluation['strength']} ({evaluation['entropy']:.1f} bits)"
+            self.strength_label.setText(
+                f"{strength} ({evaluation['entropy']:.1f} bits)"
             )
-
-            self.strength_label.setText(strength_text)
-            self.strength_label.setStyleSheet(
-                f"""
-                background-color: {color}15;
-                color: {color};
-                border: 1px solid {color}30;
-                font-weight: bold;
-            """
+            # Same bucket across keystrokes means no QSS re-parse at all
+            _set_qss_if_changed(
+                self.strength_label,
+                _STRENGTH_STYLES.get(strength, _STRENGTH_FALLBACK_QSS),
             )
         else:
             self.strength_label.clear()
-            self.strength_label.setStyleSheet("")
+            _set_qss_if_changed(self.strength_label, "")
 
+    @pyqtSlot()
     def change_master_password(self):
         """Change master password."""
         if not self.authenticated:
@@ -1734,12 +2173,14 @@ class PasswordManagerGUI(QMainWindow):
 
         # Change master password
         if self.crypto.change_master_password(old_password, new_password):
+            self._dec_cache.clear()
             QMessageBox.information(
                 self, "Success", "Master password changed successfully!"
             )
         else:
             QMessageBox.critical(self, "Error", "Failed to change master password.")
 
+    @pyqtSlot()
     def export_passwords(self):
         """Export passwords to an encrypted file."""
         if not self.authenticated:
@@ -1752,29 +2193,27 @@ class PasswordManagerGUI(QMainWindow):
             QMessageBox.information(self, "Info", "No entries to export.")
             return
 
-        # Decrypt all passwords for export
-        export_data = []
-        for entry in entries:
-            try:
-                decrypted_password = self.crypto.decrypt_password(entry["password"])
-                export_data.append(
-                    {
-                        "service": entry["service"],
-                        "username": entry["username"],
-                        "password": decrypted_password,
-                        "email": entry["email"],
-                        "notes": entry["notes"],
-                        "created_at": entry["created_at"],
-                    }
-                )
-            except Exception as e:
-                logger.error(f"Error decrypting entry for export: {e}")
-                QMessageBox.critical(
-                    self,
-                    "Error",
-                    f"Failed to decrypt entry {entry['id']}. Export cancelled.",
-                )
-                return
+        # Decrypt all passwords for export in one batch
+        try:
+            passwords = self.crypto.decrypt_many([e["password"] for e in entries])
+        except Exception as e:
+            logger.error(f"Error decrypting entries for export: {e}")
+            QMessageBox.critical(
+                self, "Error", "Failed to decrypt an entry. Export cancelled."
+            )
+            return
+
+        export_data = [
+            {
+                "service": entry["service"],
+                "username": entry["username"],
+                "password": password,
+                "email": entry["email"],
+                "notes": entry["notes"],
+                "created_at": entry["created_at"],
+            }
+            for entry, password in zip(entries, passwords)
+        ]
 
         # Ask for export password
         export_password, ok = QInputDialog.getText(
@@ -1826,14 +2265,26 @@ class PasswordManagerGUI(QMainWindow):
                 "entries": export_data,
             }
 
-            # Encrypt export data
-            encrypted_package = self.crypto.export_data_with_password(
-                export_package, export_password
+            # Serialize once, compress, then encrypt the single blob (v2
+            # format) — repetitive JSON keys compress several-fold, so far
+            # fewer bytes go through the KDF'd Fernet and onto disk
+            if orjson is not None:
+                raw = orjson.dumps(export_package)
+            else:
+                raw = json.dumps(export_package).encode("utf-8")
+            encrypted_package = self.crypto.export_blob(
+                zlib.compress(raw, 6), export_password
             )
 
-            # Save to file
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(encrypted_package, f, indent=2)
+            # Serialize in one shot and write the bytes in a single buffered
+            # call — json.dump with indent re-enters Python per token and
+            # trickles through the text layer
+            if orjson is not None:
+                payload = orjson.dumps(encrypted_package, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(encrypted_package, indent=2).encode("utf-8")
+            with open(file_path, "wb", buffering=1 << 20) as f:
+                f.write(payload)
 
             QMessageBox.information(
                 self,
@@ -1846,6 +2297,7 @@ class PasswordManagerGUI(QMainWindow):
             logger.error(f"Error exporting passwords: {e}")
             QMessageBox.critical(self, "Error", f"Export failed: {str(e)}")
 
+    @pyqtSlot()
     def export_to_pdf(self):
         """Export all entries to a well-decorated PDF file."""
         if not self.authenticated:
@@ -1871,40 +2323,60 @@ class PasswordManagerGUI(QMainWindow):
         if not file_path:
             return
 
-        try:
-            # Create PDF
-            self.create_pdf_report(file_path, entries)
+        # Build the PDF on a worker thread so the window stays responsive
+        self._pdf_entry_count = len(entries)
+        self._pdf_progress = QProgressDialog("Exporting to PDF...", None, 0, 100, self)
+        self._pdf_progress.setWindowTitle("PDF Export")
+        self._pdf_progress.setWindowModality(Qt.WindowModal)
+        self._pdf_progress.setMinimumDuration(0)
+
+        self._pdf_thread = QThread(self)
+        self._pdf_worker = PdfExportWorker(self, file_path, entries)
+        self._pdf_worker.moveToThread(self._pdf_thread)
+        self._pdf_thread.started.connect(self._pdf_worker.run)
+        self._pdf_worker.progress.connect(self._pdf_progress.setValue)
+        self._pdf_worker.finished.connect(self._on_pdf_export_done)
+        self._pdf_worker.error.connect(self._on_pdf_export_error)
+        self._pdf_worker.finished.connect(self._pdf_thread.quit)
+        self._pdf_worker.error.connect(self._pdf_thread.quit)
+        self._pdf_thread.finished.connect(self._pdf_worker.deleteLater)
+        self._pdf_thread.finished.connect(self._pdf_thread.deleteLater)
+        self._pdf_thread.start()
+
+    @pyqtSlot(str)
+    def _on_pdf_export_done(self, file_path):
+        """Show the success dialog once the PDF worker finishes."""
+        self._pdf_progress.close()
 
-            # Show success message
-            msg = QMessageBox(self)
-            msg.setWindowTitle("PDF Export Successful")
-            msg.setText(f"Successfully exported {len(entries)} entries to PDF!")
-            msg.setInformativeText(f"File saved to:\n{file_path}")
-            msg.setIcon(QMessageBox.Information)
-            msg.exec_()
+        msg = QMessageBox(self)
+        msg.setWindowTitle("PDF Export Successful")
+        msg.setText(f"Successfully exported {self._pdf_entry_count} entries to PDF!")
+        msg.setInformativeText(f"File saved to:\n{file_path}")
+        msg.setIcon(QMessageBox.Information)
+        msg.exec_()
 
-        except Exception as e:
-            logger.error(f"Error exporting to PDF: {e}")
-            QMessageBox.critical(self, "Error", f"Failed to export PDF: {str(e)}")
+    @pyqtSlot(str)
+    def _on_pdf_export_error(self, message):
+        """Report a PDF worker failure."""
+        self._pdf_progress.close()
+        QMessageBox.critical(self, "Error", f"Failed to export PDF: {message}")
 
-    def create_pdf_report(self, file_path, entries):
-        """Create a beautifully formatted PDF report."""
-        from reportlab.lib.styles import getSampleStyleSheet
+    _pdf_assets = None
 
-        # Create document
-        doc = SimpleDocTemplate(
-            file_path,
-            pagesize=A4,
-            rightMargin=72,
-            leftMargin=72,
-            topMargin=72,
-            bottomMargin=72,
-        )
+    @classmethod
+    def _get_pdf_assets(cls, colors, ParagraphStyle, getSampleStyleSheet,
+                        TableStyle, Paragraph):
+        """
+        Build (once) the styles, table rules and fixed Paragraphs shared by
+        every PDF export. getSampleStyleSheet and the ParagraphStyle
+        constructors are a measurable slice of a report build, and none of
+        them depend on the vault contents.
+        """
+        if cls._pdf_assets is not None:
+            return cls._pdf_assets
 
-        # Create styles
         styles = getSampleStyleSheet()
 
-        # Custom styles
         title_style = ParagraphStyle(
             "CustomTitle",
             parent=styles["Title"],
@@ -1929,29 +2401,29 @@ class PasswordManagerGUI(QMainWindow):
             textColor=colors.HexColor("#333333"),
         )
 
-        # Create story (content)
-        story = []
-
-        # Title
-        story.append(Paragraph(PDF_EXPORT_TITLE, title_style))
-        story.append(Spacer(1, 20))
+        header_style_bold = ParagraphStyle(
+            "TableHeader",
+            parent=normal_style,
+            fontSize=11,
+            textColor=colors.white,
+            fontName="Helvetica-Bold",
+            alignment=1,  # Center
+        )
 
-        # Report information
-        report_date = datetime.now().strftime("%d %B %Y, %I:%M %p")
-        
-        # Create Paragraph objects for text wrapping
-        info_data = [
-            [Paragraph("<b>Report Date:</b>", normal_style), Paragraph(report_date, normal_style)],
-            [Paragraph("<b>Total Entries:</b>", normal_style), Paragraph(str(len(entries)), normal_style)],
-            [Paragraph("<b>Generated By:</b>", normal_style), Paragraph(PDF_AUTHOR, normal_style)],
-            [Paragraph("<b>Application:</b>", normal_style), Paragraph(f"{APP_NAME}", normal_style)],
-        ]
+        cell_style = ParagraphStyle(
+            "TableCell",
+            parent=normal_style,
+            fontSize=9,
+            textColor=colors.HexColor("#333333"),
+            alignment=0,  # Left
+        )
 
-        info_table = Table(info_data, colWidths=[2.2 * inch, 3.8 * inch])
-        info_table.setStyle(
-            TableStyle(
+        # Shared key/value table look for the info and stats blocks; only
+        # the label-column background differs
+        def _kv_table_style(label_bg):
+            return TableStyle(
                 [
-                    ("BACKGROUND", (0, 0), (0, -1), colors.HexColor("#f8f9fa")),
+                    ("BACKGROUND", (0, 0), (0, -1), colors.HexColor(label_bg)),
                     ("BACKGROUND", (1, 0), (1, -1), colors.white),
                     ("VALIGN", (0, 0), (-1, -1), "TOP"),
                     ("ALIGN", (0, 0), (-1, -1), "LEFT"),
@@ -1963,7 +2435,122 @@ class PasswordManagerGUI(QMainWindow):
                     ("GRID", (0, 0), (-1, -1), 1, colors.HexColor("#dee2e6")),
                 ]
             )
+
+        cls._pdf_assets = {
+            "title": title_style,
+            "header": header_style,
+            "normal": normal_style,
+            "header_bold": header_style_bold,
+            "cell": cell_style,
+            "info_table_style": _kv_table_style("#f8f9fa"),
+            "stats_table_style": _kv_table_style("#3498db15"),
+            "header_row": [
+                Paragraph("<b>ID</b>", header_style_bold),
+                Paragraph("<b>Service</b>", header_style_bold),
+                Paragraph("<b>Username</b>", header_style_bold),
+                Paragraph("<b>Email</b>", header_style_bold),
+                Paragraph("<b>Password</b>", header_style_bold),
+                Paragraph("<b>Created</b>", header_style_bold),
+            ],
+            "info_labels": [
+                Paragraph("<b>Report Date:</b>", normal_style),
+                Paragraph("<b>Total Entries:</b>", normal_style),
+                Paragraph("<b>Generated By:</b>", normal_style),
+                Paragraph("<b>Application:</b>", normal_style),
+            ],
+            "base_rules": [
+                ("VALIGN", (0, 0), (-1, -1), "TOP"),
+                ("LEFTPADDING", (0, 0), (-1, -1), 6),
+                ("RIGHTPADDING", (0, 0), (-1, -1), 6),
+                ("GRID", (0, 0), (-1, -1), 1, colors.HexColor("#dee2e6")),
+                ("BOX", (0, 0), (-1, -1), 2, colors.HexColor("#2c3e50")),
+            ],
+            "header_rules": [
+                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#2c3e50")),
+                ("ALIGN", (0, 0), (-1, 0), "CENTER"),
+                ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+                ("TOPPADDING", (0, 0), (-1, 0), 8),
+            ],
+            # Entry-row rules keyed by the first data row (1 when the chunk
+            # carries the header row, 0 otherwise)
+            "data_rules": {
+                first_row: [
+                    ("ALIGN", (0, first_row), (-1, -1), "LEFT"),
+                    ("ALIGN", (0, first_row), (0, -1), "CENTER"),
+                    ("BOTTOMPADDING", (0, first_row), (-1, -1), 8),
+                    ("TOPPADDING", (0, first_row), (-1, -1), 8),
+                    # Match the Paragraph cell style for plain-string cells
+                    ("FONTNAME", (0, first_row), (-1, -1), "Helvetica"),
+                    ("FONTSIZE", (0, first_row), (-1, -1), 9),
+                    ("TEXTCOLOR", (0, first_row), (-1, -1), colors.HexColor("#333333")),
+                ]
+                for first_row in (0, 1)
+            },
+            "stats_labels": [
+                Paragraph("<b>Total Entries:</b>", normal_style),
+                Paragraph("<b>Entries with Email:</b>", normal_style),
+                Paragraph("<b>Entries with Notes:</b>", normal_style),
+                Paragraph("<b>Latest Entry:</b>", normal_style),
+            ],
+        }
+        return cls._pdf_assets
+
+    def create_pdf_report(self, file_path, entries, progress_callback=None):
+        """
+        Create a beautifully formatted PDF report.
+
+        progress_callback, if given, is called with an int 0-100 as rows are
+        prepared and the document is built.
+        """
+        # Deferred: reportlab is only needed here, keeping it out of startup
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib import colors
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+        from reportlab.lib.units import inch
+        from reportlab.pdfbase.pdfmetrics import stringWidth
+
+        # Create document. A 1 MiB buffer batches ReportLab's many small
+        # writes into a handful of syscalls
+        pdf_file = open(file_path, "wb", buffering=1 << 20)
+        doc = SimpleDocTemplate(
+            pdf_file,
+            pagesize=A4,
+            rightMargin=72,
+            leftMargin=72,
+            topMargin=72,
+            bottomMargin=72,
+        )
+
+        # Styles and fixed Paragraphs are built once per process
+        assets = self._get_pdf_assets(
+            colors, ParagraphStyle, getSampleStyleSheet, TableStyle, Paragraph
         )
+        title_style = assets["title"]
+        header_style = assets["header"]
+        normal_style = assets["normal"]
+
+        # Create story (content)
+        story = []
+
+        # Title
+        story.append(Paragraph(PDF_EXPORT_TITLE, title_style))
+        story.append(Spacer(1, 20))
+
+        # Report information
+        report_date = datetime.now().strftime("%d %B %Y, %I:%M %p")
+        
+        # Fixed labels come pre-built; only the values change per report
+        info_labels = assets["info_labels"]
+        info_data = [
+            [info_labels[0], Paragraph(report_date, normal_style)],
+            [info_labels[1], Paragraph(str(len(entries)), normal_style)],
+            [info_labels[2], Paragraph(PDF_AUTHOR, normal_style)],
+            [info_labels[3], Paragraph(f"{APP_NAME}", normal_style)],
+        ]
+
+        info_table = Table(info_data, colWidths=[2.2 * inch, 3.8 * inch])
+        info_table.setStyle(assets["info_table_style"])
 
         story.append(info_table)
         story.append(Spacer(1, 30))
@@ -1973,106 +2560,108 @@ class PasswordManagerGUI(QMainWindow):
         story.append(Spacer(1, 10))
 
         # Prepare table data with Paragraph objects for text wrapping
-        header_style_bold = ParagraphStyle(
-            "TableHeader",
-            parent=normal_style,
-            fontSize=11,
-            textColor=colors.white,
-            fontName="Helvetica-Bold",
-            alignment=1,  # Center
-        )
-        
-        cell_style = ParagraphStyle(
-            "TableCell",
-            parent=normal_style,
-            fontSize=9,
-            textColor=colors.HexColor("#333333"),
-            alignment=0,  # Left
-        )
-        
-        cell_style_center = ParagraphStyle(
-            "TableCellCenter",
-            parent=normal_style,
-            fontSize=9,
-            textColor=colors.HexColor("#333333"),
-            alignment=1,  # Center
-        )
-        
-        table_data = [
-            [
-                Paragraph("<b>ID</b>", header_style_bold),
-                Paragraph("<b>Service</b>", header_style_bold),
-                Paragraph("<b>Username</b>", header_style_bold),
-                Paragraph("<b>Email</b>", header_style_bold),
-                Paragraph("<b>Password</b>", header_style_bold),
-                Paragraph("<b>Created</b>", header_style_bold),
-            ]
-        ]
+        cell_style = assets["cell"]
+        header_row = assets["header_row"]
 
+        # Decrypt in one batch; only if the batch fails fall back to the
+        # per-entry loop so a single bad token still renders a placeholder
+        try:
+            passwords = self.crypto.decrypt_many([e["password"] for e in entries])
+        except Exception:
+            passwords = []
+            for entry in entries:
+                try:
+                    passwords.append(self.crypto.decrypt_password(entry["password"]))
+                except Exception as e:
+                    logger.error(
+                        f"Error decrypting password for entry {entry['id']}: {e}"
+                    )
+                    passwords.append("***DECRYPTION_ERROR***")
+
+        col_widths = [0.4 * inch, 1.0 * inch, 1.0 * inch, 1.2 * inch, 1.3 * inch, 0.9 * inch]
+
+        # Supplying row heights up front lets Platypus skip measuring each
+        # row (the O(n^2) _calcs path). Only email and password can wrap;
+        # rows where both fit their column get the fixed single-line height
+        # and the rare wrapping row is left as None for Platypus to measure.
+        single_line_h = cell_style.leading + 16  # one text line + padding
+        email_avail = col_widths[3] - 12  # column minus horizontal padding
+        password_avail = col_widths[4] - 12
+
+        data_rows = []
+        row_heights = []
+        append_row = data_rows.append
+        append_height = row_heights.append
+        build_row = _build_pdf_row
+        total = len(entries)
         for i, entry in enumerate(entries):
-            # Format date in readable format
-            try:
-                created_date = datetime.fromisoformat(entry["created_at"])
-                formatted_date = created_date.strftime("%d %B %Y")
-            except:
-                formatted_date = entry["created_at"]
-            
-            # Decrypt password
-            try:
-                decrypted_password = self.crypto.decrypt_password(entry["password"])
-            except Exception as e:
-                logger.error(f"Error decrypting password for entry {entry['id']}: {e}")
-                decrypted_password = "***DECRYPTION_ERROR***"
-
-            table_data.append(
-                [
-                    Paragraph(str(i + 1), cell_style_center),
-                    Paragraph(entry["service"] or "N/A", cell_style),
-                    Paragraph(entry["username"], cell_style),
-                    Paragraph(entry["email"] or "N/A", cell_style),
-                    Paragraph(decrypted_password, cell_style),
-                    Paragraph(formatted_date, cell_style),
-                ]
+            row, height = build_row(
+                i, entry, passwords[i], cell_style, Paragraph, stringWidth,
+                email_avail, password_avail, single_line_h,
+            )
+            append_row(row)
+            append_height(height)
+
+            if progress_callback and i % 64 == 0:
+                progress_callback(int(i * 80 / total))
+
+        # Style rules shared by every sub-table
+        base_style = assets["base_rules"]
+        header_rules = assets["header_rules"]
+        data_rules = assets["data_rules"]
+
+        # Platypus table layout cost grows superlinearly with row count, so
+        # large vaults are emitted as a sequence of fixed-size sub-tables
+        # instead of one monolithic Table flowable.
+        chunk_size = 500
+
+        # Two TableStyle variants cover every chunk (with/without the header
+        # row), built once per report instead of once per chunk. The
+        # ROWBACKGROUNDS command replaces a BACKGROUND entry per shaded row;
+        # ReportLab cycles the color list internally, and the even chunk
+        # size keeps the alternation in phase across chunk boundaries.
+        def _chunk_table_style(offset, with_header):
+            rules = list(base_style)
+            if with_header:
+                rules.extend(header_rules)
+            rules.extend(data_rules[offset])
+            rules.append(
+                (
+                    "ROWBACKGROUNDS",
+                    (0, offset),
+                    (-1, -1),
+                    [colors.white, colors.HexColor("#f8f9fa")],
+                )
             )
+            return TableStyle(rules)
 
-        # Create table with adjusted column widths
-        table = Table(
-            table_data,
-            colWidths=[0.4 * inch, 1.0 * inch, 1.0 * inch, 1.2 * inch, 1.3 * inch, 0.9 * inch],
-        )
+        first_style = _chunk_table_style(1, with_header=True)
+        rest_style = _chunk_table_style(0, with_header=False)
 
-        # Build table style dynamically to avoid index errors
-        table_style = [
-            # Header style
-            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#2c3e50")),
-            ("VALIGN", (0, 0), (-1, -1), "TOP"),
-            ("ALIGN", (0, 0), (-1, 0), "CENTER"),
-            ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-            ("TOPPADDING", (0, 0), (-1, 0), 8),
-            ("LEFTPADDING", (0, 0), (-1, -1), 6),
-            ("RIGHTPADDING", (0, 0), (-1, -1), 6),
-            # Text style for all data rows
-            ("ALIGN", (0, 1), (-1, -1), "LEFT"),
-            ("ALIGN", (0, 1), (0, -1), "CENTER"),
-            ("BOTTOMPADDING", (0, 1), (-1, -1), 8),
-            ("TOPPADDING", (0, 1), (-1, -1), 8),
-            # Grid
-            ("GRID", (0, 0), (-1, -1), 1, colors.HexColor("#dee2e6")),
-            ("BOX", (0, 0), (-1, -1), 2, colors.HexColor("#2c3e50")),
-        ]
+        starts = range(0, len(data_rows), chunk_size) if data_rows else [0]
+        for start in starts:
+            chunk = data_rows[start:start + chunk_size]
+            with_header = start == 0
 
-        # Add alternating row colors for existing rows only
-        num_rows = len(table_data)
-        for i in range(1, num_rows):
-            if i % 2 == 0:  # Even rows (2, 4, 6, etc.)
-                if i < num_rows:
-                    table_style.append(
-                        ("BACKGROUND", (0, i), (-1, i), colors.HexColor("#f8f9fa"))
-                    )
+            if not chunk:
+                # Empty vault: emit the bare header so the section isn't blank
+                empty_table = Table([header_row], colWidths=col_widths)
+                empty_table.setStyle(TableStyle(base_style + header_rules))
+                story.append(empty_table)
+                continue
 
-        table.setStyle(TableStyle(table_style))
+            chunk_heights = row_heights[start:start + chunk_size]
+            chunk_table = Table(
+                ([header_row] + chunk) if with_header else chunk,
+                colWidths=col_widths,
+                rowHeights=([None] + chunk_heights) if with_header else chunk_heights,
+            )
+            chunk_table.setStyle(first_style if with_header else rest_style)
+            story.append(chunk_table)
+
+        if progress_callback:
+            progress_callback(85)
 
-        story.append(table)
         story.append(Spacer(1, 30))
 
         # Statistics
@@ -2084,37 +2673,19 @@ class PasswordManagerGUI(QMainWindow):
         # Format latest entry date
         latest_entry_formatted = "N/A"
         if stats["latest_entry"]:
-            try:
-                latest_date = datetime.fromisoformat(stats["latest_entry"])
-                latest_entry_formatted = latest_date.strftime("%d %B %Y, %I:%M %p")
-            except:
-                latest_entry_formatted = stats["latest_entry"]
+            latest_entry_formatted = _fmt_created(stats["latest_entry"])
         
-        # Create Paragraph objects for text wrapping
+        # Fixed labels come pre-built; only the values change per report
+        stats_labels = assets["stats_labels"]
         stats_data = [
-            [Paragraph("<b>Total Entries:</b>", normal_style), Paragraph(str(stats["total_entries"]), normal_style)],
-            [Paragraph("<b>Entries with Email:</b>", normal_style), Paragraph(str(stats["entries_with_email"]), normal_style)],
-            [Paragraph("<b>Entries with Notes:</b>", normal_style), Paragraph(str(stats["entries_with_notes"]), normal_style)],
-            [Paragraph("<b>Latest Entry:</b>", normal_style), Paragraph(latest_entry_formatted, normal_style)],
+            [stats_labels[0], Paragraph(str(stats["total_entries"]), normal_style)],
+            [stats_labels[1], Paragraph(str(stats["entries_with_email"]), normal_style)],
+            [stats_labels[2], Paragraph(str(stats["entries_with_notes"]), normal_style)],
+            [stats_labels[3], Paragraph(latest_entry_formatted, normal_style)],
         ]
 
         stats_table = Table(stats_data, colWidths=[2.2 * inch, 3.8 * inch])
-        stats_table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (0, -1), colors.HexColor("#3498db15")),
-                    ("BACKGROUND", (1, 0), (1, -1), colors.white),
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    ("FONTSIZE", (0, 0), (-1, -1), 10),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
-                    ("TOPPADDING", (0, 0), (-1, -1), 8),
-                    ("LEFTPADDING", (0, 0), (-1, -1), 8),
-                    ("RIGHTPADDING", (0, 0), (-1, -1), 8),
-                    ("GRID", (0, 0), (-1, -1), 1, colors.HexColor("#dee2e6")),
-                ]
-            )
-        )
+        stats_table.setStyle(assets["stats_table_style"])
 
         story.append(stats_table)
         story.append(Spacer(1, 40))
@@ -2132,9 +2703,17 @@ class PasswordManagerGUI(QMainWindow):
 
         story.append(Paragraph(footer_text, normal_style))
 
-        # Build PDF
-        doc.build(story)
+        # Build PDF (SimpleDocTemplate streams pages to the buffered file)
+        if progress_callback:
+            progress_callback(90)
+        try:
+            doc.build(story)
+        finally:
+            pdf_file.close()
+        if progress_callback:
+            progress_callback(100)
 
+    @pyqtSlot()
     def import_passwords(self):
         """Import passwords from an encrypted file."""
         if not self.authenticated:
@@ -2164,9 +2743,26 @@ class PasswordManagerGUI(QMainWindow):
             return
 
         try:
-            # Load encrypted package
-            with open(file_path, "r", encoding="utf-8") as f:
-                encrypted_package = json.load(f)
+            # Memory-map the file so the kernel pages bytes straight into
+            # the parser (C-parsed when orjson exists) with no read buffer
+            # in between; mmap rejects empty files, which are invalid
+            # imports anyway, so those fall back to a plain read
+            with open(file_path, "rb") as f:
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    raw = f.read()
+                    encrypted_package = (
+                        orjson.loads(raw) if orjson is not None else json.loads(raw)
+                    )
+                else:
+                    with mm:
+                        # memoryview hands orjson the pages zero-copy; the
+                        # stdlib parser needs a real bytes object
+                        encrypted_package = (
+                            orjson.loads(memoryview(mm)) if orjson is not None
+                            else json.loads(mm[:])
+                        )
 
             # Decrypt data
             decrypted_data = self.crypto.import_data_with_password(
@@ -2196,14 +2792,16 @@ class PasswordManagerGUI(QMainWindow):
             preview_text = QLabel(f"Found {len(entries)} entries in import file:")
             layout.addWidget(preview_text)
 
-            # Preview list
+            # Preview list: addItems inserts the batch under one model
+            # notification instead of one per row
             preview_list = QListWidget()
-            for i, entry in enumerate(entries[:10], 1):
-                service = entry.get("service", "(no service)")
-                preview_list.addItem(f"{i}. {service} - {entry['username']}")
-
+            items = [
+                f"{i}. {entry.get('service', '(no service)')} - {entry['username']}"
+                for i, entry in enumerate(entries[:10], 1)
+            ]
             if len(entries) > 10:
-                preview_list.addItem(f"... and {len(entries) - 10} more entries")
+                items.append(f"... and {len(entries) - 10} more entries")
+            preview_list.addItems(items)
 
             layout.addWidget(preview_list)
 
@@ -2231,25 +2829,86 @@ class PasswordManagerGUI(QMainWindow):
 
             skip_duplicates = skip_radio.isChecked()
 
-            # Import entries
-            imported_count = 0
-            skipped_count = 0
-            failed_count = 0
-
-            progress = QProgressDialog(
+            # Import on a worker thread; the modal progress dialog stays
+            # responsive without processEvents and can cancel cleanly
+            self._import_total = len(entries)
+            self._import_progress = QProgressDialog(
                 "Importing entries...", "Cancel", 0, len(entries), self
             )
-            progress.setWindowTitle("Import Progress")
-            progress.setWindowModality(Qt.WindowModal)
-            progress.setMinimumDuration(0)
+            self._import_progress.setWindowTitle("Import Progress")
+            self._import_progress.setWindowModality(Qt.WindowModal)
+            self._import_progress.setMinimumDuration(0)
+
+            self._import_thread = QThread(self)
+            self._import_worker = ImportWorker(self, entries, skip_duplicates)
+            self._import_worker.moveToThread(self._import_thread)
+
+            self._import_thread.started.connect(self._import_worker.run)
+            self._import_worker.progress.connect(self._on_import_progress)
+            self._import_progress.canceled.connect(
+                self._import_worker.cancel, Qt.DirectConnection
+            )
+            self._import_worker.finished.connect(self._on_import_done)
+            self._import_worker.error.connect(self._on_import_error)
+            self._import_worker.finished.connect(self._import_thread.quit)
+            self._import_worker.error.connect(self._import_thread.quit)
+            self._import_thread.finished.connect(self._import_worker.deleteLater)
+            self._import_thread.finished.connect(self._import_thread.deleteLater)
+
+            self._import_thread.start()
+
+        except ValueError as e:
+            QMessageBox.critical(
+                self,
+                "Import Error",
+                f"Failed to import: {str(e)}\n\n"
+                "Possible causes:\n"
+                "- Incorrect password\n"
+                "- Corrupted export file\n"
+                "- Invalid file format",
+            )
+        except Exception as e:
+            logger.error(f"Error importing passwords: {e}")
+            QMessageBox.critical(self, "Error", f"Import failed: {str(e)}")
+
+    def _import_entries(self, entries, skip_duplicates, progress_callback, cancelled):
+        """
+        Run the import loop. Called by ImportWorker off the GUI thread, so
+        this must only touch the database and crypto — all widget updates
+        happen in the progress/finished handlers.
 
+        Returns:
+            (imported, skipped, failed) counts
+        """
+        imported_count = 0
+        skipped_count = 0
+        failed_count = 0
+
+        # One read builds the duplicate index; each row then costs a dict
+        # lookup instead of an entry_exists query (and, for duplicates, a
+        # full vault re-read). -1 marks rows added during this import whose
+        # id hasn't been needed yet.
+        index = {
+            (e["service"], e["username"]): e["id"]
+            for e in self.db.iter_all_entries()
+        }
+
+        # The session key is derived once at authenticate, so each call here
+        # is pure AES/HMAC; binding the method skips N attribute lookups
+        encrypt_password = self.crypto.encrypt_password
+
+        # One transaction for the whole batch: commits (and their fsyncs)
+        # drop from one per row to one per import
+        self.db.begin_bulk()
+        try:
             for i, entry in enumerate(entries):
-                if progress.wasCanceled():
+                if cancelled():
                     break
 
-                progress.setValue(i)
-                progress.setLabelText(f"Importing entry {i+1} of {len(entries)}...")
-                QApplication.processEvents()
+                # Throttle cross-thread signals: one queued event per 50
+                # rows is plenty for a progress bar
+                if i % 50 == 0:
+                    progress_callback(i)
 
                 service = entry.get("service")
                 username = entry["username"]
@@ -2257,40 +2916,36 @@ class PasswordManagerGUI(QMainWindow):
                 email = entry.get("email")
                 notes = entry.get("notes")
 
-                # Check if entry exists
-                exists = self.db.entry_exists(service, username)
+                key = (service, username)
+                entry_id = index.get(key)
 
-                if exists and skip_duplicates:
+                if entry_id is not None and skip_duplicates:
                     skipped_count += 1
                     continue
 
                 # Encrypt password
                 try:
-                    encrypted_password = self.crypto.encrypt_password(password)
-
-                    if exists and not skip_duplicates:
-                        # Find entry ID to update
-                        all_entries = self.db.get_all_entries()
-                        for db_entry in all_entries:
-                            if (
-                                db_entry["service"] == service
-                                and db_entry["username"] == username
-                            ):
-                                self.db.update_entry(
-                                    db_entry["id"],
-                                    service,
-                                    username,
-                                    encrypted_password,
-                                    email,
-                                    notes,
-                                )
-                                imported_count += 1
-                                break
+                    encrypted_password = encrypt_password(password)
+
+                    if entry_id is not None:
+                        if entry_id == -1:
+                            entry_id = self.db.get_entry_id(service, username)
+                        self.db.update_entry(
+                            entry_id,
+                            service,
+                            username,
+                            encrypted_password,
+                            email,
+                            notes,
+                        )
+                        index[key] = entry_id
+                        imported_count += 1
                     else:
                         # Add new entry
                         if self.db.add_entry(
                             service, username, encrypted_password, email, notes
                         ):
+                            index[key] = -1
                             imported_count += 1
                         else:
                             failed_count += 1
@@ -2299,40 +2954,47 @@ class PasswordManagerGUI(QMainWindow):
                     logger.error(f"Error importing entry {username}: {e}")
                     failed_count += 1
 
-            progress.close()
+        finally:
+            self.db.commit_bulk()
 
-            # Show results
-            result_message = f"""
-            <h3>Import Results</h3>
-            <p><b>Imported:</b> {imported_count} entries</p>
-            <p><b>Skipped:</b> {skipped_count} duplicates</p>
-            <p><b>Failed:</b> {failed_count} entries</p>
-            """
+        return imported_count, skipped_count, failed_count
 
-            result_dialog = QMessageBox(self)
-            result_dialog.setWindowTitle("Import Complete")
-            result_dialog.setTextFormat(Qt.RichText)
-            result_dialog.setText(result_message)
-            result_dialog.setIcon(QMessageBox.Information)
-            result_dialog.exec_()
+    @pyqtSlot(int)
+    def _on_import_progress(self, i):
+        """Advance the import progress dialog."""
+        self._import_progress.setValue(i)
+        self._import_progress.setLabelText(
+            f"Importing entry {i + 1} of {self._import_total}..."
+        )
 
-            # Refresh entries list
-            self.refresh_entries()
-            self.update_statistics()
+    @pyqtSlot(int, int, int)
+    def _on_import_done(self, imported_count, skipped_count, failed_count):
+        """Close the progress dialog and report the import counts."""
+        self._import_progress.close()
 
-        except ValueError as e:
-            QMessageBox.critical(
-                self,
-                "Import Error",
-                f"Failed to import: {str(e)}\n\n"
-                "Possible causes:\n"
-                "- Incorrect password\n"
-                "- Corrupted export file\n"
-                "- Invalid file format",
-            )
-        except Exception as e:
-            logger.error(f"Error importing passwords: {e}")
-            QMessageBox.critical(self, "Error", f"Import failed: {str(e)}")
+        result_message = f"""
+        <h3>Import Results</h3>
+        <p><b>Imported:</b> {imported_count} entries</p>
+        <p><b>Skipped:</b> {skipped_count} duplicates</p>
+        <p><b>Failed:</b> {failed_count} entries</p>
+        """
+
+        result_dialog = QMessageBox(self)
+        result_dialog.setWindowTitle("Import Complete")
+        result_dialog.setTextFormat(Qt.RichText)
+        result_dialog.setText(result_message)
+        result_dialog.setIcon(QMessageBox.Information)
+        result_dialog.exec_()
+
+        # Refresh entries list
+        self.refresh_entries()
+        self.update_statistics()
+
+    @pyqtSlot(str)
+    def _on_import_error(self, message):
+        """Close the progress dialog and surface the import failure."""
+        self._import_progress.close()
+        QMessageBox.critical(self, "Error", f"Import failed: {message}")
 
 
 class PasswordGeneratorDialog(QDialog):
@@ -2351,140 +3013,37 @@ class PasswordGeneratorDialog(QDialog):
 
     def apply_dark_theme(self):
         """Apply dark theme to dialog."""
-        self.dark_mode = True
-        self.setStyleSheet(self.get_dark_stylesheet())
-    
+        self._apply_theme(True)
+
     def apply_light_theme(self):
         """Apply light theme to dialog."""
-        self.dark_mode = False
-        self.setStyleSheet(self.get_light_stylesheet())
+        self._apply_theme(False)
+
+    def _apply_theme(self, dark):
+        """Restyle the dialog (and its theme-keyed widgets) for a theme."""
+        self.dark_mode = dark
+        self.setStyleSheet(_GEN_DIALOG_QSS[dark])
+        # The per-widget styles were picked at init time; refresh them so
+        # the cached dialog follows a theme toggle between opens
+        if hasattr(self, "length_label"):
+            self.length_label.setStyleSheet(_GEN_LENGTH_LABEL_QSS[dark])
+            self.password_display.setStyleSheet(_GEN_PW_DISPLAY_QSS[dark])
     
     def get_dark_stylesheet(self):
         """Get dark theme stylesheet."""
-        return """
-            QDialog {
-                background-color: #1e1e1e;
-                border-radius: 10px;
-            }
-            
-            QLabel {
-                color: #e0e0e0;
-            }
-            
-            QCheckBox {
-                color: #e0e0e0;
-            }
-            
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #444;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-                color: #e0e0e0;
-            }
-            
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #e0e0e0;
-            }
-            
-            QSlider::groove:horizontal {
-                height: 6px;
-                background: #444;
-                border-radius: 3px;
-            }
-            
-            QSlider::handle:horizontal {
-                background: #5DADE2;
-                width: 20px;
-                height: 20px;
-                margin: -7px 0;
-                border-radius: 10px;
-            }
-            
-            QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #5DADE2, stop: 1 #2E86C1);
-                color: white;
-                padding: 10px 20px;
-                border-radius: 6px;
-                font-weight: bold;
-                border: none;
-            }
-            
-            QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #2E86C1, stop: 1 #1B4965);
-            }
-            """
-    
+        return _GEN_DIALOG_QSS[True]
+
     def get_light_stylesheet(self):
         """Get light theme stylesheet."""
-        return """
-            QDialog {
-                background-color: white;
-                border-radius: 10px;
-            }
-            
-            QLabel {
-                color: #333333;
-            }
-            
-            QCheckBox {
-                color: #333333;
-            }
-            
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #dee2e6;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 10px;
-                color: #333333;
-            }
-            
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #333333;
-            }
-            
-            QSlider::groove:horizontal {
-                height: 6px;
-                background: #dee2e6;
-                border-radius: 3px;
-            }
-            
-            QSlider::handle:horizontal {
-                background: #3498db;
-                width: 20px;
-                height: 20px;
-                margin: -7px 0;
-                border-radius: 10px;
-            }
-            
-            QPushButton {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #5DADE2, stop: 1 #2E86C1);
-                color: white;
-                padding: 10px 20px;
-                border-radius: 6px;
-                font-weight: bold;
-                border: none;
-            }
-            
-            QPushButton:hover {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                    stop: 0 #2E86C1, stop: 1 #1B4965);
-            }
-            """
-    
+        return _GEN_DIALOG_QSS[False]
+
+
     def init_ui(self):
         """Initialize the dialog UI."""
+        # Suspend repaints while the widget tree is assembled so the
+        # stylesheet/polish/layout passes collapse into one at the end
+        self.setUpdatesEnabled(False)
+
         self.setWindowTitle("Password Generator")
         self.setMinimumWidth(450)
         
@@ -2504,28 +3063,22 @@ class PasswordGeneratorDialog(QDialog):
         self.length_slider = QSlider(Qt.Horizontal)
         self.length_slider.setRange(8, 50)
         self.length_slider.setValue(20)
-        self.length_slider.valueChanged.connect(self.generate_password)
+        # A drag fires valueChanged dozens of times; the label tracks every
+        # tick while the regenerate + restyle work is debounced to run once
+        # shortly after the drag settles
+        self._regen_timer = QTimer(self)
+        self._regen_timer.setSingleShot(True)
+        self._regen_timer.setInterval(60)
+        self._regen_timer.timeout.connect(self.generate_password)
+        self.length_slider.valueChanged.connect(
+            self._on_length_changed, Qt.DirectConnection
+        )
         length_layout.addWidget(self.length_slider, 1)
 
         self.length_label = QLabel("20")
         self.length_label.setMinimumWidth(30)
         self.length_label.setAlignment(Qt.AlignCenter)
-        
-        # Set length label style based on theme
-        if self.dark_mode:
-            length_label_style = """
-            font-weight: bold;
-            font-size: 14px;
-            color: #2ECC71;
-        """
-        else:
-            length_label_style = """
-            font-weight: bold;
-            font-size: 14px;
-            color: #2c3e50;
-        """
-        
-        self.length_label.setStyleSheet(length_label_style)
+        self.length_label.setStyleSheet(_GEN_LENGTH_LABEL_QSS[self.dark_mode])
         length_layout.addWidget(self.length_label)
 
         layout.addWidget(length_group)
@@ -2562,53 +3115,13 @@ class PasswordGeneratorDialog(QDialog):
 
         self.password_display = QLineEdit()
         self.password_display.setReadOnly(True)
-        
-        # Set password display style based on theme
-        if self.dark_mode:
-            password_style = """
-            font-family: 'Courier New', monospace;
-            font-size: 14px;
-            font-weight: bold;
-            padding: 10px;
-            border: 2px solid #444;
-            border-radius: 6px;
-            background-color: #2d2d2d;
-            color: #2ECC71;
-        """
-        else:
-            password_style = """
-            font-family: 'Courier New', monospace;
-            font-size: 14px;
-            font-weight: bold;
-            padding: 10px;
-            border: 2px solid #dee2e6;
-            border-radius: 6px;
-            background-color: #f8f9fa;
-            color: #2c3e50;
-        """
-        
-        self.password_display.setStyleSheet(password_style)
+        self.password_display.setStyleSheet(_GEN_PW_DISPLAY_QSS[self.dark_mode])
         password_layout.addWidget(self.password_display)
 
         # Entropy display
         self.entropy_label = QLabel()
         self.entropy_label.setAlignment(Qt.AlignCenter)
-        
-        # Set entropy label style based on theme
-        if self.dark_mode:
-            entropy_style = """
-            font-size: 12px;
-            color: #3498db;
-            padding: 5px;
-        """
-        else:
-            entropy_style = """
-            font-size: 12px;
-            color: #7f8c8d;
-            padding: 5px;
-        """
-        
-        self.entropy_label.setStyleSheet(entropy_style)
+        self.entropy_label.setStyleSheet(_GEN_ENTROPY_QSS)
         password_layout.addWidget(self.entropy_label)
 
         layout.addWidget(password_group)
@@ -2616,129 +3129,84 @@ class PasswordGeneratorDialog(QDialog):
         # Buttons
         button_layout = QHBoxLayout()
 
-        generate_btn = QPushButton("Generate New")
-        generate_btn.clicked.connect(self.generate_password)
-        generate_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                padding: 8px 15px;
-                border-radius: 6px;
-                font-weight: normal;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """
-        )
-        button_layout.addWidget(generate_btn)
+        # Styling comes from the objectName rules in the dialog sheet, so
+        # the factory only names, wires and places each button
+        def _make_button(text, name, slot):
+            btn = QPushButton(text)
+            btn.setObjectName(name)
+            btn.clicked.connect(slot)
+            button_layout.addWidget(btn)
+            return btn
 
-        copy_btn = QPushButton("Copy")
-        copy_btn.clicked.connect(self.copy_password)
-        copy_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                padding: 8px 15px;
-                border-radius: 6px;
-                font-weight: normal;
-            }
-            QPushButton:hover {
-                background-color: #229954;
-            }
-        """
-        )
-        button_layout.addWidget(copy_btn)
+        _make_button("Generate New", "genBtn", self.generate_password)
+        _make_button("Copy", "copyBtn", self.copy_password)
+        _make_button("Use This Password", "useBtn", self.use_password)
+        _make_button("Cancel", "cancelBtn", self.reject)
 
-        use_btn = QPushButton("Use This Password")
-        use_btn.clicked.connect(self.use_password)
-        use_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #f39c12;
-                color: white;
-                padding: 8px 15px;
-                border-radius: 6px;
-                font-weight: normal;
-            }
-            QPushButton:hover {
-                background-color: #d68910;
-            }
-        """
-        )
-        button_layout.addWidget(use_btn)
+        layout.addLayout(button_layout)
 
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.clicked.connect(self.reject)
-        cancel_btn.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                padding: 8px 15px;
-                border-radius: 6px;
-                font-weight: normal;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-        """
-        )
-        button_layout.addWidget(cancel_btn)
+        self.setUpdatesEnabled(True)
+        self.ensurePolished()
 
-        layout.addLayout(button_layout)
+    @pyqtSlot(int)
+    def _on_length_changed(self, value):
+        """Track the slider instantly, regenerate once the drag settles."""
+        self.length_label.setText(str(value))
+        self._regen_timer.start()
 
+    @pyqtSlot()
     def generate_password(self):
         """Generate a new password."""
-        self.length_label.setText(str(self.length_slider.value()))
+        length = self.length_slider.value()
 
         try:
-            password = self.password_gen.generate_password(
-                length=self.length_slider.value(),
+            password = _pg_generate(
+                length=length,
                 include_lowercase=self.lower_check.isChecked(),
                 include_uppercase=self.upper_check.isChecked(),
                 include_digits=self.digits_check.isChecked(),
                 include_symbols=self.symbols_check.isChecked(),
             )
-            self.password_display.setText(password)
-
-            # Calculate and display entropy
-            entropy = self.password_gen.calculate_entropy(password)
-            strength = self.password_gen.evaluate_strength(password)
-
-            color_map = {
-                "Very Weak": "#e74c3c",
-                "Weak": "#e67e22",
-                "Moderate": "#f1c40f",
-                "Strong": "#2ecc71",
-                "Very Strong": "#27ae60",
-            }
-
-            color = color_map.get(strength["strength"], "#7f8c8d")
-            self.entropy_label.setText(
-                f"Strength: <b>{strength['strength']}</b> | "
-                f"Entropy: <b>{entropy:.1f} bits</b>"
-            )
-            self.entropy_label.setStyleSheet(
-                f"""
-                font-size: 12px;
-                color: {color};
-                padding: 5px;
-            """
-            )
-
         except ValueError as e:
             QMessageBox.warning(self, "Error", str(e))
+            return
+
+        entropy = _pg_entropy(password)
+        strength = _pg_evaluate(password)
+        color = _GEN_STRENGTH_COLORS.get(strength["strength"], "#7f8c8d")
+
+        # Apply all three texts in one repaint pass: updates are suspended
+        # for the duration and the widgets' change signals are blocked so
+        # each setText doesn't fan out its own cascade
+        self.setUpdatesEnabled(False)
+        try:
+            blockers = (
+                QSignalBlocker(self.length_label),
+                QSignalBlocker(self.password_display),
+                QSignalBlocker(self.entropy_label),
+            )
+            try:
+                self.length_label.setText(str(length))
+                self.password_display.setText(password)
+                self.entropy_label.setText(
+                    f'<span style="color:{color}">Strength: '
+                    f"<b>{strength['strength']}</b></span> | "
+                    f"Entropy: <b>{entropy:.1f} bits</b>"
+                )
+            finally:
+                del blockers
+        finally:
+            self.setUpdatesEnabled(True)
 
+    @pyqtSlot()
     def copy_password(self):
         """Copy generated password to clipboard."""
         password = self.password_display.text()
         if password:
-            pyperclip.copy(password)
+            _copy_to_clipboard(password)
             QMessageBox.information(self, "Success", "Password copied to clipboard!")
 
+    @pyqtSlot()
     def use_password(self):
         """Use the generated password."""
         self.generated_password = self.password_display.text()
@@ -2756,6 +3224,9 @@ def main():
     # Create and run application
     app = QApplication(sys.argv)
 
+    # Give Qt's pixmap cache enough room so icon scaling is done once
+    QPixmapCache.setCacheLimit(10240)
+
     # Set application style
     app.setStyle("Fusion")
 
@@ -9,260 +9,427 @@ import math
 from typing import List, Dict, Optional
 from config import DEFAULT_PASSWORD_LENGTH, PASSWORD_CHARSET, MIN_PASSWORD_LENGTH, MAX_PASSWORD_LENGTH
 
+# Character-class sets for entropy/strength classification, built once
+_LOWER_SET = frozenset(string.ascii_lowercase)
+_UPPER_SET = frozenset(string.ascii_uppercase)
+_DIGIT_SET = frozenset(string.digits)
+_SYMBOL_SET = frozenset(PASSWORD_CHARSET['symbols'])
+_SYMBOL_POOL = len(_SYMBOL_SET)
 
-class PasswordGenerator:
-    """Generates secure random passwords."""
+# Character-class bitmask machinery: a 256-byte translate table maps each
+# byte to its class bit, so one C-level translate plus an or-fold replaces
+# a regex search per class
+_BIT_LOWER = 1
+_BIT_UPPER = 2
+_BIT_DIGIT = 4
+_BIT_SYMBOL = 8
+
+_CLASS_POOL_SIZES = ((_BIT_LOWER, 26), (_BIT_UPPER, 26),
+                     (_BIT_DIGIT, 10), (_BIT_SYMBOL, _SYMBOL_POOL))
+
+# log2 of the pool size for each of the 16 class-mask combinations, so
+# entropy is a table lookup and one multiply with no summation or math
+# call per evaluation. An empty mask falls back to the conservative
+# lowercase-only pool of 26.
+_POOL_LOG2 = tuple(
+    math.log2(sum(size for bit, size in _CLASS_POOL_SIZES if mask & bit) or 26)
+    for mask in range(16)
+)
+
+_CHARCLASS_TBL = bytes(
+    _BIT_LOWER if chr(i) in _LOWER_SET
+    else _BIT_UPPER if chr(i) in _UPPER_SET
+    else _BIT_DIGIT if chr(i) in _DIGIT_SET
+    else _BIT_SYMBOL if chr(i) in _SYMBOL_SET
+    else 0
+    for i in range(256)
+)
+
+# Well-known weak substrings folded into one alternation, compiled once
+_COMMON_PATTERNS = (
+    '123456', 'password', 'qwerty', 'admin', 'welcome',
+    'letmein', 'monkey', 'dragon', 'baseball', 'football'
+)
+_COMMON_RE = re.compile('|'.join(map(re.escape, _COMMON_PATTERNS)), re.IGNORECASE)
+
+
+# One SystemRandom for the module; the per-call construction in the old
+# shuffle path was pure overhead
+_SYSRAND = secrets.SystemRandom()
+
+
+def _shuffle_inplace(seq: list) -> None:
+    """
+    In-place Fisher-Yates shuffle fed from batched urandom draws.
+
+    SystemRandom.shuffle makes one kernel round-trip per element; this
+    pulls one token_bytes block (refilled only when rejection sampling
+    exhausts it) and masks each byte down to the needed range. Single
+    bytes cover every index while len(seq) <= 256, which comfortably
+    includes the longest password; anything larger falls back to the
+    stock shuffle.
+    """
+    n = len(seq)
+    if n < 2:
+        return
+    if n > 256:
+        _SYSRAND.shuffle(seq)
+        return
+
+    buf = secrets.token_bytes(2 * n)
+    pos = 0
+    limit = len(buf)
+    for i in range(n - 1, 0, -1):
+        mask = (1 << i.bit_length()) - 1
+        while True:
+            if pos >= limit:
+                buf = secrets.token_bytes(2 * n)
+                pos = 0
+            j = buf[pos] & mask
+            pos += 1
+            if j <= i:
+                break
+        seq[i], seq[j] = seq[j], seq[i]
+
+
+def _class_mask(password: str) -> int:
+    """Or-fold the class bits of every character in the password."""
+    # set() dedupes the translated bytes in C, so the Python-level fold
+    # touches at most five distinct values (the four class bits plus 0)
+    # regardless of password length
+    mask = 0
+    for bit in set(password.encode('utf-8', 'replace').translate(_CHARCLASS_TBL)):
+        mask |= bit
+    return mask
+
+
+def _entropy_from_mask(length: int, mask: int) -> float:
+    """
+    Entropy in bits from a precomputed class mask, so callers that already
+    classified the password don't scan it again.
+    """
+    # Entropy formula L * log2(N); the mask indexes the precomputed table
+    # directly, which also bakes in the conservative empty-mask fallback
+    return length * _POOL_LOG2[mask & 15]
+
+
+def generate_password(length: int = DEFAULT_PASSWORD_LENGTH, 
+                     include_lowercase: bool = True,
+                     include_uppercase: bool = True,
+                     include_digits: bool = True,
+                     include_symbols: bool = True) -> str:
+    """
+    Generate a secure random password.
     
-    @staticmethod
-    def generate_password(length: int = DEFAULT_PASSWORD_LENGTH, 
-                         include_lowercase: bool = True,
-                         include_uppercase: bool = True,
-                         include_digits: bool = True,
-                         include_symbols: bool = True) -> str:
-        """
-        Generate a secure random password.
-        
-        Args:
-            length: Length of password (8-100)
-            include_lowercase: Include lowercase letters
-            include_uppercase: Include uppercase letters
-            include_digits: Include digits
-            include_symbols: Include symbols
-            
-        Returns:
-            Generated password
-            
-        Raises:
-            ValueError: If no character types are selected or length is invalid
-        """
-        if length < MIN_PASSWORD_LENGTH or length > MAX_PASSWORD_LENGTH:
-            raise ValueError(f"Password length must be between {MIN_PASSWORD_LENGTH} and {MAX_PASSWORD_LENGTH}")
-        
-        # Build character pool
-        char_pool = ""
-        requirements = {}
-        
-        if include_lowercase:
-            char_pool += PASSWORD_CHARSET['lowercase']
-            requirements['lowercase'] = PASSWORD_CHARSET['lowercase']
-        
-        if include_uppercase:
-            char_pool += PASSWORD_CHARSET['uppercase']
-            requirements['uppercase'] = PASSWORD_CHARSET['uppercase']
-        
-        if include_digits:
-            char_pool += PASSWORD_CHARSET['digits']
-            requirements['digits'] = PASSWORD_CHARSET['digits']
-        
-        if include_symbols:
-            char_pool += PASSWORD_CHARSET['symbols']
-            requirements['symbols'] = PASSWORD_CHARSET['symbols']
-        
-        if not char_pool:
-            raise ValueError("At least one character type must be selected")
-        
-        # Ensure at least one character from each selected type
-        password_chars = []
-        
-        # Add one character from each required type
-        for charset in requirements.values():
-            password_chars.append(secrets.choice(charset))
-        
-        # Fill remaining length with random characters from the pool
-        remaining_length = length - len(password_chars)
-        if remaining_length > 0:
-            password_chars.extend(secrets.choice(char_pool) for _ in range(remaining_length))
-        
-        # Shuffle the characters
-        secrets.SystemRandom().shuffle(password_chars)
-        
-        return ''.join(password_chars)
+    Args:
+        length: Length of password (8-100)
+        include_lowercase: Include lowercase letters
+        include_uppercase: Include uppercase letters
+        include_digits: Include digits
+        include_symbols: Include symbols
+        
+    Returns:
+        Generated password
+        
+    Raises:
+        ValueError: If no character types are selected or length is invalid
+    """
+    if length < MIN_PASSWORD_LENGTH or length > MAX_PASSWORD_LENGTH:
+        raise ValueError(f"Password length must be between {MIN_PASSWORD_LENGTH} and {MAX_PASSWORD_LENGTH}")
+
+    return _generate_from_pool(
+        length,
+        _resolve_pool(include_lowercase, include_uppercase,
+                      include_digits, include_symbols),
+    )
+
+
+# Pool data per include-flag combination, assembled on first use: the
+# concatenation, ascii encoding and rejection mask are identical for every
+# password drawn with the same flags
+_POOL_CACHE: Dict[tuple, tuple] = {}
+
+
+def _resolve_pool(include_lowercase: bool, include_uppercase: bool,
+                  include_digits: bool, include_symbols: bool) -> tuple:
+    """
+    Resolve the include flags to (pool_bytes, pool_size, bit_mask,
+    required_charsets), cached per flag combination.
+
+    Raises:
+        ValueError: If no character types are selected
+    """
+    key = (include_lowercase, include_uppercase, include_digits, include_symbols)
+    cached = _POOL_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    char_pool = ""
+    requirements = []
+
+    if include_lowercase:
+        char_pool += PASSWORD_CHARSET['lowercase']
+        requirements.append(PASSWORD_CHARSET['lowercase'])
+
+    if include_uppercase:
+        char_pool += PASSWORD_CHARSET['uppercase']
+        requirements.append(PASSWORD_CHARSET['uppercase'])
+
+    if include_digits:
+        char_pool += PASSWORD_CHARSET['digits']
+        requirements.append(PASSWORD_CHARSET['digits'])
+
+    if include_symbols:
+        char_pool += PASSWORD_CHARSET['symbols']
+        requirements.append(PASSWORD_CHARSET['symbols'])
+
+    if not char_pool:
+        raise ValueError("At least one character type must be selected")
+
+    pool = char_pool.encode('ascii')
+    entry = (pool, len(pool), (1 << (len(pool) - 1).bit_length()) - 1,
+             tuple(requirements))
+    _POOL_CACHE[key] = entry
+    return entry
+
+
+def _generate_from_pool(length: int, pool_entry: tuple) -> str:
+    """Draw one password of the given length from a resolved pool entry."""
+    pool, pool_size, bit_mask, requirements = pool_entry
+
+    # Ensure at least one character from each selected type
+    password_chars = [secrets.choice(charset) for charset in requirements]
+
+    # Fill remaining length from batched randomness: one randbits draw
+    # covers (nearly always) the whole fill, instead of one urandom
+    # round-trip per character via secrets.choice. Indices are peeled
+    # off the big integer bits_per at a time with shift/mask arithmetic
+    # in CPython's big-int code; any index past the pool size is
+    # rejected, keeping the distribution uniform.
+    remaining_length = length - len(password_chars)
+    if remaining_length > 0:
+        bits_per = bit_mask.bit_length()
+        filled = bytearray()
+        need = remaining_length
+        while need > 0:
+            # Acceptance rate is >= 50%, so 2x oversampling plus slack
+            # makes a second draw rare
+            chunks = need * 2 + 8
+            big = secrets.randbits(chunks * bits_per)
+            for _ in range(chunks):
+                idx = big & bit_mask
+                big >>= bits_per
+                if idx < pool_size:
+                    filled.append(pool[idx])
+                    need -= 1
+                    if need == 0:
+                        break
+        password_chars.extend(filled.decode('ascii'))
+
+    # Shuffle the characters
+    _shuffle_inplace(password_chars)
+
+    return ''.join(password_chars)
+
+
+# Frozen at module scope so the word list isn't rebuilt per call; a tuple
+# also gives the fastest element fetch. Simple list (in production, use a
+# larger one)
+_WORDLIST = (
+    "apple", "brave", "cloud", "dragon", "eagle", "flame", "globe", "honey",
+    "island", "jungle", "knight", "lunar", "mountain", "nova", "ocean", "planet",
+    "quantum", "river", "star", "tiger", "unicorn", "volcano", "whale", "xray",
+    "yellow", "zebra", "alpha", "beta", "gamma", "delta"
+)
+
+_PASSPHRASE_SYMBOLS = "!@#$%^&*"
+
+
+def generate_passphrase(num_words: int = 4, separator: str = "-") -> str:
+    """
+    Generate a passphrase using a small word list.
     
-    @staticmethod
-    def generate_passphrase(num_words: int = 4, separator: str = "-") -> str:
-        """
-        Generate a passphrase using a small word list.
-        
-        Args:
-            num_words: Number of words in passphrase (3-8)
-            separator: Word separator
-            
-        Returns:
-            Generated passphrase
-        """
-        if num_words < 3 or num_words > 8:
-            raise ValueError("Number of words must be between 3 and 8")
-        
-        # Simple word list (in production, use a larger list)
-        word_list = [
-            "apple", "brave", "cloud", "dragon", "eagle", "flame", "globe", "honey",
-            "island", "jungle", "knight", "lunar", "mountain", "nova", "ocean", "planet",
-            "quantum", "river", "star", "tiger", "unicorn", "volcano", "whale", "xray",
-            "yellow", "zebra", "alpha", "beta", "gamma", "delta"
-        ]
-        
-        words = [secrets.choice(word_list) for _ in range(num_words)]
-        
-        # Capitalize some words and add numbers/symbols for strength
-        if secrets.randbelow(2):
-            words[secrets.randbelow(num_words)] = words[secrets.randbelow(num_words)].upper()
-        
-        # Add a number
-        words.append(str(secrets.randbelow(100)))
-        
-        # Add a symbol
-        symbols = list("!@#$%^&*")
-        words.append(secrets.choice(symbols))
-        
-        # Shuffle
-        secrets.SystemRandom().shuffle(words)
-        
-        return separator.join(words)
+    Args:
+        num_words: Number of words in passphrase (3-8)
+        separator: Word separator
+        
+    Returns:
+        Generated passphrase
+    """
+    if num_words < 3 or num_words > 8:
+        raise ValueError("Number of words must be between 3 and 8")
     
-    @staticmethod
-    def calculate_entropy(password: str) -> float:
-        """
-        Calculate password entropy in bits.
-        
-        Args:
-            password: Password to analyze
-            
-        Returns:
-            Entropy in bits
-        """
-        if not password:
-            return 0.0
-        
-        # Determine character pool size
-        char_pool_size = 0
-        if any(c.islower() for c in password):
-            char_pool_size += 26
-        if any(c.isupper() for c in password):
-            char_pool_size += 26
-        if any(c.isdigit() for c in password):
-            char_pool_size += 10
-        if any(c in PASSWORD_CHARSET['symbols'] for c in password):
-            char_pool_size += len(PASSWORD_CHARSET['symbols'])
-        
-        # If we couldn't determine, use conservative estimate
-        if char_pool_size == 0:
-            char_pool_size = 26  # Assume lowercase only
-        
-        # Calculate entropy using the formula: L * log2(N)
-        # where L is password length, N is character pool size
-        try:
-            entropy = len(password) * math.log2(char_pool_size)
-        except ValueError:
-            # Fallback in case log2 fails
-            entropy = len(password) * math.log(char_pool_size, 2)
-        
-        return entropy
+    words = [secrets.choice(_WORDLIST) for _ in range(num_words)]
+
+    # Capitalize one word (sometimes) and add a number/symbol for strength
+    if secrets.randbelow(2):
+        idx = secrets.randbelow(num_words)
+        words[idx] = words[idx].upper()
+
+    # Add a number
+    words.append(str(secrets.randbelow(100)))
+
+    # Add a symbol
+    words.append(secrets.choice(_PASSPHRASE_SYMBOLS))
     
-    @staticmethod
-    def evaluate_strength(password: str) -> Dict[str, any]:
-        """
-        Evaluate password strength.
-        
-        Args:
-            password: Password to evaluate
-            
-        Returns:
-            Dictionary with strength evaluation
-        """
-        if not password:
-            return {"strength": "Very Weak", "score": 0, "entropy": 0.0, "length": 0, "feedback": []}
-        
-        score = 0
-        feedback = []
-        
-        # Length check
-        if len(password) >= 12:
-            score += 2
-        elif len(password) >= 8:
-            score += 1
-        else:
-            feedback.append("Password is too short (minimum 8 characters)")
-        
-        # Character variety checks
-        if re.search(r'[a-z]', password):
-            score += 1
-        else:
-            feedback.append("Add lowercase letters")
-        
-        if re.search(r'[A-Z]', password):
-            score += 1
-        else:
-            feedback.append("Add uppercase letters")
-        
-        if re.search(r'\d', password):
-            score += 1
-        else:
-            feedback.append("Add numbers")
-        
-        if re.search(f'[{re.escape(PASSWORD_CHARSET["symbols"])}]', password):
-            score += 1
-        else:
-            feedback.append("Add symbols")
-        
-        # Entropy check
-        entropy = PasswordGenerator.calculate_entropy(password)
-        if entropy > 80:
-            score += 2
-        elif entropy > 60:
-            score += 1
-        
-        # Common patterns to avoid
-        common_patterns = [
-            '123456', 'password', 'qwerty', 'admin', 'welcome',
-            'letmein', 'monkey', 'dragon', 'baseball', 'football'
-        ]
-        
-        password_lower = password.lower()
-        for pattern in common_patterns:
-            if pattern in password_lower:
-                score -= 2
-                feedback.append(f"Avoid common pattern '{pattern}'")
-                break
-        
-        # Determine strength level
-        if score >= 7:
-            strength = "Very Strong"
-        elif score >= 5:
-            strength = "Strong"
-        elif score >= 3:
-            strength = "Moderate"
-        elif score >= 1:
-            strength = "Weak"
-        else:
-            strength = "Very Weak"
-        
-        return {
-            "strength": strength,
-            "score": score,
-            "entropy": entropy,
-            "length": len(password),
-            "feedback": feedback,
-            "has_lowercase": bool(re.search(r'[a-z]', password)),
-            "has_uppercase": bool(re.search(r'[A-Z]', password)),
-            "has_digits": bool(re.search(r'\d', password)),
-            "has_symbols": bool(re.search(f'[{re.escape(PASSWORD_CHARSET["symbols"])}]', password))
-        }
+    # Shuffle
+    _shuffle_inplace(words)
     
-    @staticmethod
-    def generate_multiple_passwords(count: int = 5, length: int = DEFAULT_PASSWORD_LENGTH, 
-                                   **kwargs) -> List[str]:
-        """
-        Generate multiple passwords.
-        
-        Args:
-            count: Number of passwords to generate (1-20)
-            length: Length of each password
-            **kwargs: Additional arguments for generate_password
-            
-        Returns:
-            List of generated passwords
-        """
-        if count < 1 or count > 20:
-            raise ValueError("Count must be between 1 and 20")
-        
-        return [PasswordGenerator.generate_password(length, **kwargs) for _ in range(count)]
\ No newline at end of file
+    return separator.join(words)
+
+
+def calculate_entropy(password: str) -> float:
+    """
+    Calculate password entropy in bits.
+    
+    Args:
+        password: Password to analyze
+        
+    Returns:
+        Entropy in bits
+    """
+    if not password:
+        return 0.0
+
+    # One translate pass classifies every character; the pool size and
+    # log2 lookup come from the shared mask helper
+    return _entropy_from_mask(len(password), _class_mask(password))
+
+
+def evaluate_strength(password: str) -> Dict[str, any]:
+    """
+    Evaluate password strength.
+    
+    Args:
+        password: Password to evaluate
+        
+    Returns:
+        Dictionary with strength evaluation
+    """
+    if not password:
+        return {"strength": "Very Weak", "score": 0, "entropy": 0.0, "length": 0,
+                "feedback": [], "has_lowercase": False, "has_uppercase": False,
+                "has_digits": False, "has_symbols": False}
+    
+    score = 0
+    feedback = []
+    length = len(password)
+
+    # Length check
+    if length >= 12:
+        score += 2
+    elif length >= 8:
+        score += 1
+    else:
+        feedback.append("Password is too short (minimum 8 characters)")
+
+    # Character variety: one translate pass yields all four class flags
+    mask = _class_mask(password)
+    has_lowercase = bool(mask & _BIT_LOWER)
+    has_uppercase = bool(mask & _BIT_UPPER)
+    has_digits = bool(mask & _BIT_DIGIT)
+    has_symbols = bool(mask & _BIT_SYMBOL)
+
+    if has_lowercase:
+        score += 1
+    else:
+        feedback.append("Add lowercase letters")
+
+    if has_uppercase:
+        score += 1
+    else:
+        feedback.append("Add uppercase letters")
+
+    if has_digits:
+        score += 1
+    else:
+        feedback.append("Add numbers")
+
+    if has_symbols:
+        score += 1
+    else:
+        feedback.append("Add symbols")
+
+    # Entropy check, reusing the mask instead of rescanning
+    entropy = _entropy_from_mask(length, mask)
+    if entropy > 80:
+        score += 2
+    elif entropy > 60:
+        score += 1
+
+    # Common patterns to avoid, in one case-insensitive compiled
+    # alternation -- no lowercased copy of the password needed
+    match = _COMMON_RE.search(password)
+    if match:
+        score -= 2
+        feedback.append(f"Avoid common pattern '{match.group(0).lower()}'")
+
+    # Determine strength level
+    if score >= 7:
+        strength = "Very Strong"
+    elif score >= 5:
+        strength = "Strong"
+    elif score >= 3:
+        strength = "Moderate"
+    elif score >= 1:
+        strength = "Weak"
+    else:
+        strength = "Very Weak"
+
+    return {
+        "strength": strength,
+        "score": score,
+        "entropy": entropy,
+        "length": length,
+        "feedback": feedback,
+        "has_lowercase": has_lowercase,
+        "has_uppercase": has_uppercase,
+        "has_digits": has_digits,
+        "has_symbols": has_symbols
+    }
+
+
+def generate_multiple_passwords(count: int = 5, length: int = DEFAULT_PASSWORD_LENGTH, 
+                               **kwargs) -> List[str]:
+    """
+    Generate multiple passwords.
+    
+    Args:
+        count: Number of passwords to generate (1-20)
+        length: Length of each password
+        **kwargs: Additional arguments for generate_password
+        
+    Returns:
+        List of generated passwords
+    """
+    if count < 1 or count > 20:
+        raise ValueError("Count must be between 1 and 20")
+
+    if length < MIN_PASSWORD_LENGTH or length > MAX_PASSWORD_LENGTH:
+        raise ValueError(f"Password length must be between {MIN_PASSWORD_LENGTH} and {MAX_PASSWORD_LENGTH}")
+
+    # Validate once and resolve the pool once instead of re-doing both
+    # per password inside generate_password
+    pool_entry = _resolve_pool(
+        kwargs.get('include_lowercase', True),
+        kwargs.get('include_uppercase', True),
+        kwargs.get('include_digits', True),
+        kwargs.get('include_symbols', True),
+    )
+    return [_generate_from_pool(length, pool_entry) for _ in range(count)]
+
+
+class PasswordGenerator:
+    """
+    Thin namespace shim over the module-level functions, kept so existing
+    call sites (and the GUI's lazily built instance) keep working. The
+    functions themselves live at module scope so hot callers can bind them
+    once without class-attribute and staticmethod-descriptor lookups per
+    call.
+    """
+
+    generate_password = staticmethod(generate_password)
+    generate_passphrase = staticmethod(generate_passphrase)
+    calculate_entropy = staticmethod(calculate_entropy)
+    evaluate_strength = staticmethod(evaluate_strength)
+    generate_multiple_passwords = staticmethod(generate_multiple_passwords)